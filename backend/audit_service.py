@@ -11,29 +11,224 @@ HARD RULES:
 """
 import json
 import logging
+import queue
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 
-from models import AuditLog, ActionType
+from models import AuditLog, Auditable, ActionType
 from config import get_settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 settings = get_settings()
 
+# Settings are an immutable process-wide singleton; snapshot the fields read
+# on every audited action so the hot paths use bare module globals instead of
+# pydantic attribute access.
+_AUDIT_LOGS_ENABLED: bool = settings.audit_logs_enabled
+_COMPLIANCE_MODE: bool = settings.compliance_mode
+
 logger = logging.getLogger(__name__)
 
 
+def _dump_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize audit metadata; orjson is several times faster than stdlib
+    json for the small dicts we log, and handles datetimes natively."""
+    if orjson is not None:
+        return orjson.dumps(metadata).decode()
+    return json.dumps(metadata, default=str)
+
+
+# ============== Batched Writes ==============
+#
+# Audit events are high-volume and commit-bound: one INSERT + COMMIT per event
+# means one fsync per event. Instead we enqueue lightweight dicts and flush them
+# in batches from a background thread (single bulk insert + single commit per
+# flush window). Compliance mode keeps the original synchronous path so that
+# strict environments never lose an event on crash.
+
+# Value -> member lookup for action type validation. A plain dict get avoids
+# the exception-driven ActionType(value) path on every audited action.
+_ACTION_BY_VALUE = {m.value: m for m in ActionType}
+
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+AUDIT_QUEUE_MAX_SIZE = 10000  # Bounded so a stuck flusher can't exhaust memory
+
+_audit_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=AUDIT_QUEUE_MAX_SIZE)
+_flusher_lock = threading.Lock()
+_flusher_started = False
+
+
+def _drain_batch(timeout: float = AUDIT_FLUSH_INTERVAL_SECONDS) -> List[Dict[str, Any]]:
+    """Collect up to AUDIT_BATCH_SIZE entries, waiting at most `timeout` for the first."""
+    batch: List[Dict[str, Any]] = []
+    try:
+        batch.append(_audit_queue.get(timeout=timeout))
+    except queue.Empty:
+        return batch
+    while len(batch) < AUDIT_BATCH_SIZE:
+        try:
+            batch.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write_batch(batch: List[Dict[str, Any]]) -> bool:
+    """Write a batch of audit entries in one bulk insert + one commit."""
+    if not batch:
+        return True
+    # Flusher uses its own session - never shares the request session.
+    from database import SessionLocal
+    session = SessionLocal()
+    try:
+        session.bulk_insert_mappings(AuditLog, batch)
+        session.commit()
+        return True
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Failed to flush audit log batch ({len(batch)} entries): {str(e)}")
+        print(f"CRITICAL: Failed to flush audit log batch! {str(e)}")
+        return False
+    finally:
+        session.close()
+
+
+def _flusher_loop():
+    """Background loop: drain the queue and bulk-insert batches."""
+    while True:
+        batch = _drain_batch()
+        if batch:
+            _write_batch(batch)
+
+
+def _start_flusher():
+    """Start the background flusher thread (idempotent)."""
+    global _flusher_started
+    with _flusher_lock:
+        if not _flusher_started:
+            thread = threading.Thread(
+                target=_flusher_loop,
+                name="audit-log-flusher",
+                daemon=True
+            )
+            thread.start()
+            _flusher_started = True
+
+
+def flush_audit_logs() -> int:
+    """
+    Synchronously drain and write all queued audit entries.
+
+    Call from shutdown hooks to avoid losing buffered events.
+    Returns the number of entries flushed.
+    """
+    flushed = 0
+    while True:
+        batch = []
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                batch.append(_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return flushed
+        _write_batch(batch)
+        flushed += len(batch)
+
+
+# ============== Automatic Auditing via Session Events ==============
+#
+# Models that mix in `Auditable` (models.py) are audit-logged automatically
+# when flushed - no manual log_action wiring at each call site. Entries go
+# through the same batched queue, so the audit path adds no extra commit to
+# the business write. Explicit log_action calls remain the right tool where
+# richer provenance metadata (model version, prompt version, ...) is needed.
+
+@event.listens_for(Session, "after_flush")
+def _audit_flushed_entities(session: Session, flush_context) -> None:
+    """Enqueue audit entries for Auditable instances in this flush."""
+    if not _AUDIT_LOGS_ENABLED:
+        return
+
+    for obj in session.new:
+        if isinstance(obj, Auditable):
+            _enqueue_auto_audit(obj, "created")
+
+    for obj in session.dirty:
+        if not isinstance(obj, Auditable) or not session.is_modified(obj):
+            continue
+        changed = {}
+        state = inspect(obj)
+        for field in obj.__audit_fields__:
+            history = state.attrs[field].history
+            if history.has_changes():
+                changed[field] = {
+                    "old": _jsonable(history.deleted[0]) if history.deleted else None,
+                    "new": _jsonable(history.added[0]) if history.added else None
+                }
+        if changed:
+            _enqueue_auto_audit(obj, "updated", changed=changed)
+
+
+def _jsonable(value: Any) -> Any:
+    """Coerce attribute values into something json.dumps accepts."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _enqueue_auto_audit(obj: Auditable, change: str, changed: Optional[Dict] = None) -> None:
+    """Build and enqueue an audit entry for a flushed Auditable instance."""
+    action = _ACTION_BY_VALUE.get(obj.__audit_action__)
+    if action is None:
+        logger.error(f"Auditable model {type(obj).__name__} has invalid __audit_action__")
+        return
+
+    metadata: Dict[str, Any] = {"auto": True, "change": change}
+    if change == "created":
+        snapshot = {f: _jsonable(getattr(obj, f, None)) for f in obj.__audit_fields__}
+        if snapshot:
+            metadata["fields"] = snapshot
+    elif changed:
+        metadata["changed"] = changed
+
+    try:
+        _start_flusher()
+        _audit_queue.put_nowait({
+            "action_type": action,
+            "entity_type": type(obj).__name__,
+            "entity_id": getattr(obj, "id", None),
+            "project_id": getattr(obj, "project_id", None),
+            "user_id": "system",
+            "metadata_json": _dump_metadata(metadata),
+            "compliance_mode_active": _COMPLIANCE_MODE,
+            "created_at": datetime.utcnow()
+        })
+    except queue.Full:
+        logger.error("Audit log queue full - dropping auto-audit entry")
+
+
 def log_action(
     db: Session,
     action_type: str,
     entity_type: str,
     entity_id: Optional[int],
     user_id: Optional[str] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    project_id: Optional[int] = None,
+    commit: bool = True
 ) -> bool:
     """
     Log a critical system action.
-    
+
     Args:
         db: Database session
         action_type: Type of action (from ActionType enum)
@@ -41,39 +236,70 @@ def log_action(
         entity_id: ID of the entity
         user_id: User identifier (or "system")
         metadata: JSON-serializable dictionary with provenance info
-        
+        project_id: Owning project, so child-entity logs appear in the
+            project audit trail without scanning metadata_json
+        commit: In compliance mode, pass False when the caller commits the
+            session itself so the entry rides the endpoint's transaction
+            (one fsync) instead of adding its own
+
     Returns:
         bool: True if logged successfully
     """
-    if not settings.audit_logs_enabled:
+    if not _AUDIT_LOGS_ENABLED:
         return True
         
     try:
-        # Validate action type
-        try:
-            a_type = ActionType(action_type)
-        except ValueError:
+        # Validate action type (dict lookup, no exception on the hot path)
+        a_type = _ACTION_BY_VALUE.get(action_type)
+        if a_type is None:
             logger.error(f"Invalid audit action type: {action_type}")
             # Fallback to keep logging if possible, or just log error?
             # For compliance, we should probably fail safe, but for reliability, we log error and maybe persist as generic?
             # We'll raise or return False. Let's return False but log error.
             return False
-            
-        metadata_json = json.dumps(metadata) if metadata else None
-        
-        log_entry = AuditLog(
-            action_type=a_type,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            user_id=user_id or "system",
-            metadata_json=metadata_json,
-            compliance_mode_active=settings.compliance_mode
-        )
-        
-        db.add(log_entry)
-        db.commit()
+
+
+        metadata_json = _dump_metadata(metadata) if metadata else None
+
+        # Project-level logs always carry their own id as project scope
+        if project_id is None and entity_type == "Project":
+            project_id = entity_id
+
+        # Compliance mode: keep the synchronous write-through path so events
+        # are durable before the action returns.
+        if _COMPLIANCE_MODE:
+            log_entry = AuditLog(
+                action_type=a_type,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                project_id=project_id,
+                user_id=user_id or "system",
+                metadata_json=metadata_json,
+                compliance_mode_active=_COMPLIANCE_MODE
+            )
+            db.add(log_entry)
+            if commit:
+                db.commit()
+            return True
+
+        # Normal mode: enqueue for the background flusher (batched commit).
+        _start_flusher()
+        _audit_queue.put_nowait({
+            "action_type": a_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "project_id": project_id,
+            "user_id": user_id or "system",
+            "metadata_json": metadata_json,
+            "compliance_mode_active": _COMPLIANCE_MODE,
+            "created_at": datetime.utcnow()
+        })
         return True
-        
+
+    except queue.Full:
+        logger.error("Audit log queue full - dropping entry")
+        print("CRITICAL: Audit log queue full! Entry dropped.")
+        return False
     except Exception as e:
         logger.error(f"Failed to write audit log: {str(e)}")
         # In a strict compliance system, we might want to raise this to block the action.
@@ -83,43 +309,119 @@ def log_action(
         return False
 
 
+def log_action_deferred(
+    background,
+    db: Session,
+    action_type: str,
+    entity_type: str,
+    entity_id: Optional[int],
+    user_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    project_id: Optional[int] = None,
+    commit: bool = True
+) -> bool:
+    """
+    Log an action after the response has flushed.
+
+    Endpoints pass their FastAPI BackgroundTasks; the metadata serialization
+    and queue handoff then happen off the request's critical path. In
+    compliance mode this falls back to the synchronous log_action so the
+    event is durable before the endpoint returns - same guarantee as before.
+    Callers that commit the session after this call should pass commit=False
+    so the compliance-mode entry shares the endpoint's transaction.
+    """
+    if not _AUDIT_LOGS_ENABLED:
+        return True
+
+    if _COMPLIANCE_MODE:
+        return log_action(db, action_type, entity_type, entity_id, user_id, metadata, project_id, commit)
+
+    # Outside compliance mode log_action only enqueues and never touches the
+    # session, so the request session (closed by then) is not passed along.
+    background.add_task(
+        log_action, None, action_type, entity_type, entity_id, user_id, metadata, project_id
+    )
+    return True
+
+
+def export_audit_logs_before(
+    db: Session,
+    cutoff: datetime,
+    archive_path: str,
+    batch_size: int = 1000
+) -> int:
+    """
+    Export audit entries older than `cutoff` to a newline-delimited JSON file.
+
+    The audit log is append-only and rows are never deleted, so on SQLite the
+    table (and its indexes) grows without bound. This gives operators a
+    partition-like maintenance path: periodically export closed time ranges
+    to immutable cold storage (e.g. object-lock buckets), so the live table
+    can be rebuilt from a bounded window if it ever becomes a problem. The
+    function only reads - it never mutates the table.
+
+    Returns the number of entries exported. Streams in id-keyed batches so
+    memory stays bounded regardless of table size.
+    """
+    exported = 0
+    last_id = 0
+    with open(archive_path, "a", encoding="utf-8") as out:
+        while True:
+            rows = db.query(AuditLog).filter(
+                AuditLog.created_at < cutoff,
+                AuditLog.id > last_id
+            ).order_by(AuditLog.id.asc()).limit(batch_size).all()
+            if not rows:
+                return exported
+            for row in rows:
+                out.write(json.dumps({
+                    "id": row.id,
+                    "action_type": row.action_type.value if row.action_type else None,
+                    "entity_type": row.entity_type,
+                    "entity_id": row.entity_id,
+                    "project_id": row.project_id,
+                    "user_id": row.user_id,
+                    "metadata_json": row.metadata_json,
+                    "compliance_mode_active": row.compliance_mode_active,
+                    "created_at": row.created_at.isoformat() if row.created_at else None
+                }) + "\n")
+                last_id = row.id
+            exported += len(rows)
+
+
 def get_project_audit_trail(
     db: Session,
     project_id: int,
+    before_ts: Optional[datetime] = None,
     limit: int = 100
 ) -> List[AuditLog]:
     """
     Retrieve audit logs for a specific project.
-    
-    Includes logs where:
-    - entity_type="Project" AND entity_id=project_id
-    - entity_type="ClaimDraft" AND logs link to project (requires join or separate logic)
-    
-    For simplicity in Phase 10, we'll fetch logs explicitly tagged with Project:{id}
-    or we can try to fetch related entities if we log project_id in metadata.
-    
-    Best practice: Always log project_id in metadata for child entities.
+
+    Covers both project-level logs and child entities (ClaimDraft,
+    DraftVersion, ...) via the denormalized AuditLog.project_id column,
+    which callers set at log time. This is an index range scan on
+    (project_id, created_at) - no metadata_json scans.
+
+    Pagination is keyset-based: pass the `created_at` of the last entry from
+    the previous page as `before_ts` to fetch the next page. This keeps
+    latency bounded by `limit` instead of table size (no OFFSET scans).
     """
-    # 1. Direct project logs
-    query = db.query(AuditLog).filter(
-        AuditLog.entity_type == "Project",
-        AuditLog.entity_id == project_id
-    )
-    
-    # 2. Child entity logs (if we had a way to join, but AuditLog is generic)
-    # Strategy: Filter by project_id in metadata? No, that's slow (JSON scan).
-    # Strategy: Just show project level logs for now, or ensure critical child logs
-    #           are "double logged" or associated.
-    #           Better: The main UI view is usually "Project History".
-    #           We'll stick to Entity=Project for high level, and maybe others.
-    
-    # Actually, let's just return timestamps descending.
+    query = db.query(AuditLog).filter(AuditLog.project_id == project_id)
+
+    if before_ts is not None:
+        query = query.filter(AuditLog.created_at < before_ts)
+
     return query.order_by(AuditLog.created_at.desc()).limit(limit).all()
 
 
 def get_recent_system_logs(
     db: Session,
+    before_ts: Optional[datetime] = None,
     limit: int = 50
 ) -> List[AuditLog]:
-    """Get global recent logs (admin view)."""
-    return db.query(AuditLog).order_by(AuditLog.created_at.desc()).limit(limit).all()
+    """Get global recent logs (admin view). Keyset-paginated via `before_ts`."""
+    query = db.query(AuditLog)
+    if before_ts is not None:
+        query = query.filter(AuditLog.created_at < before_ts)
+    return query.order_by(AuditLog.created_at.desc()).limit(limit).all()
@@ -13,6 +13,9 @@ import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from sqlalchemy import case, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from models import (
@@ -38,6 +41,11 @@ SIMILARITY_CLARITY_THRESHOLD = 0.20  # Difference between highest scores
 # Contexts that never get HIGH confidence
 RESTRICTED_CONTEXTS = {"PATENT", "LEGAL", "MEDICAL", "FINANCIAL"}
 
+# Feedback types counted as disagreement (shared, never mutated)
+_DISAGREE_TYPES = frozenset({
+    FeedbackType.DISAGREE, FeedbackType.NOT_HELPFUL, FeedbackType.NEEDS_REVISION
+})
+
 
 # ============== Data Classes ==============
 
@@ -82,9 +90,44 @@ def calculate_confidence(
     notes: List[str] = []
     metrics: Dict[str, Any] = {}
     
-    # Get project info
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    # Get project type, novelty risk, evidence count and feedback aggregates
+    # in ONE round trip. Previously this was four separate queries (Project,
+    # count(CandidateEvidence), AnalysisState, feedback stats) re-issued on
+    # every badge render because calibration is deliberately never cached.
+    # The counts are scalar subqueries so only scalars cross the wire - no
+    # ORM hydration.
+    evidence_count_sq = db.query(
+        func.count(CandidateEvidence.id)
+    ).filter(
+        CandidateEvidence.project_id == project_id
+    ).scalar_subquery()
+
+    feedback_count_sq = db.query(
+        func.count(UserFeedback.id)
+    ).filter(
+        UserFeedback.project_id == project_id
+    ).scalar_subquery()
+
+    disagreement_count_sq = db.query(
+        func.coalesce(
+            func.sum(case((UserFeedback.feedback_type.in_(_DISAGREE_TYPES), 1), else_=0)),
+            0
+        )
+    ).filter(
+        UserFeedback.project_id == project_id
+    ).scalar_subquery()
+
+    row = db.query(
+        Project.type,
+        AnalysisState.novelty_risk,
+        evidence_count_sq,
+        feedback_count_sq,
+        disagreement_count_sq
+    ).outerjoin(
+        AnalysisState, AnalysisState.project_id == Project.id
+    ).filter(Project.id == project_id).first()
+
+    if not row:
         return CalibrationResult(
             confidence_level=ConfidenceLevel.LOW.value,
             human_review_recommended=True,
@@ -92,65 +135,50 @@ def calculate_confidence(
             calibration_notes=["Project not found"],
             metrics={}
         )
-    
+
+    project_type, novelty_risk, evidence_count, total_feedback, disagreements = row
+
     # Check for restricted context
-    is_restricted_context = project.type == ProjectType.PATENT
+    is_restricted_context = project_type == ProjectType.PATENT
     if is_restricted_context:
         notes.append(NOTE_PATENT_CONTEXT)
-    
-    # Get evidence count
-    evidence_count = db.query(CandidateEvidence).filter(
-        CandidateEvidence.project_id == project_id
-    ).count()
+
     metrics["evidence_count"] = evidence_count
-    
+
     if evidence_count < EVIDENCE_COUNT_LOW_THRESHOLD:
         notes.append(NOTE_LOW_EVIDENCE)
-    
-    # Get novelty risk from analysis state
-    analysis_state = db.query(AnalysisState).filter(
-        AnalysisState.project_id == project_id
-    ).first()
-    
-    novelty_risk = NoveltyRiskLevel.UNKNOWN
-    if analysis_state:
-        novelty_risk = analysis_state.novelty_risk
+
+    if novelty_risk is None:
+        novelty_risk = NoveltyRiskLevel.UNKNOWN
     metrics["novelty_risk"] = novelty_risk.value if novelty_risk else "UNKNOWN"
     
     if novelty_risk == NoveltyRiskLevel.RED:
         notes.append(NOTE_NOVELTY_RED)
     
-    # Get feedback stats
-    feedback_list = db.query(UserFeedback).filter(
-        UserFeedback.project_id == project_id
-    ).all()
-    
-    total_feedback = len(feedback_list)
     metrics["total_feedback"] = total_feedback
-    
+
     if total_feedback == 0:
         notes.append(NOTE_NO_FEEDBACK)
         disagreement_rate = 0.0
     else:
-        disagree_types = {FeedbackType.DISAGREE, FeedbackType.NOT_HELPFUL, FeedbackType.NEEDS_REVISION}
-        disagreements = sum(1 for f in feedback_list if f.feedback_type in disagree_types)
         disagreement_rate = disagreements / total_feedback
-    
+
     metrics["disagreement_rate"] = round(disagreement_rate, 3)
     
     high_disagreement = disagreement_rate > DISAGREEMENT_HIGH_THRESHOLD
     if high_disagreement:
         notes.append(NOTE_HIGH_DISAGREEMENT)
     
-    # Get similarity score clarity
-    scores = db.query(SimilarityScore).filter(
+    # Get similarity score clarity: only the top two scalar scores are needed
+    # for the clarity check, so fetch just the score column (no ORM rows).
+    top_scores = db.query(SimilarityScore.score).filter(
         SimilarityScore.project_id == project_id
-    ).order_by(SimilarityScore.score.desc()).limit(5).all()
-    
+    ).order_by(SimilarityScore.score.desc()).limit(2).all()
+
     similarity_clarity = 0.0
-    if len(scores) >= 2:
-        top_score = scores[0].score_float
-        second_score = scores[1].score_float
+    if len(top_scores) >= 2:
+        top_score = top_scores[0][0] / 10000.0
+        second_score = top_scores[1][0] / 10000.0
         similarity_clarity = abs(top_score - second_score)
     metrics["similarity_clarity"] = round(similarity_clarity, 3)
     
@@ -223,61 +251,61 @@ def get_or_create_calibration(
     """
     # Always recalculate (no caching that hides changes)
     result = calculate_confidence(db, project_id)
-    
-    # Update stored calibration
-    existing = db.query(ConfidenceCalibration).filter(
-        ConfidenceCalibration.project_id == project_id
-    ).first()
-    
-    if existing:
-        existing.confidence_level = ConfidenceLevel(result.confidence_level)
-        existing.human_review_recommended = result.human_review_recommended
-        existing.disagreement_flag = result.disagreement_flag
-        existing.calibration_notes = json.dumps(result.calibration_notes)
-        existing.total_feedback_count = result.metrics.get("total_feedback", 0)
-        existing.disagreement_count = int(result.metrics.get("disagreement_rate", 0) * result.metrics.get("total_feedback", 0))
-        existing.evidence_count = result.metrics.get("evidence_count", 0)
-    else:
-        calibration = ConfidenceCalibration(
-            project_id=project_id,
-            confidence_level=ConfidenceLevel(result.confidence_level),
-            human_review_recommended=result.human_review_recommended,
-            disagreement_flag=result.disagreement_flag,
-            calibration_notes=json.dumps(result.calibration_notes),
-            total_feedback_count=result.metrics.get("total_feedback", 0),
-            evidence_count=result.metrics.get("evidence_count", 0)
-        )
-        db.add(calibration)
-    
+
+    # Store via a single INSERT ... ON CONFLICT DO UPDATE keyed on the unique
+    # project_id - one statement instead of SELECT + update/insert, and no
+    # race window between the read and the write.
+    total_feedback = result.metrics.get("total_feedback", 0)
+    values = dict(
+        project_id=project_id,
+        confidence_level=ConfidenceLevel(result.confidence_level),
+        human_review_recommended=result.human_review_recommended,
+        disagreement_flag=result.disagreement_flag,
+        calibration_notes=json.dumps(result.calibration_notes),
+        total_feedback_count=total_feedback,
+        disagreement_count=int(result.metrics.get("disagreement_rate", 0) * total_feedback),
+        evidence_count=result.metrics.get("evidence_count", 0),
+        updated_at=datetime.utcnow()
+    )
+    stmt = sqlite_insert(ConfidenceCalibration).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ConfidenceCalibration.project_id],
+        set_={k: getattr(stmt.excluded, k) for k in values if k != "project_id"}
+    )
+    db.execute(stmt)
     db.commit()
-    
+
     return result
 
 
+# Badge display metadata is pure and immutable - built once at import time.
+# MappingProxyType guards against callers mutating the shared dicts.
+_BADGES: Dict[str, Dict[str, str]] = {
+    "LOW": MappingProxyType({
+        "label": "Low Confidence",
+        "color": "orange",
+        "icon": "⚠️",
+        "description": "Results require careful review. Human oversight recommended."
+    }),
+    "MEDIUM": MappingProxyType({
+        "label": "Medium Confidence",
+        "color": "blue",
+        "icon": "ℹ️",
+        "description": "Results based on available evidence. Review before acting."
+    }),
+    "HIGH": MappingProxyType({
+        "label": "High Confidence",
+        "color": "green",
+        "icon": "✓",
+        "description": "Strong evidence support. Standard review sufficient."
+    })
+}
+
+
 def get_confidence_badge(confidence_level: str) -> Dict[str, str]:
     """
     Get display properties for confidence badge.
-    
+
     Used by frontend to render appropriate styling.
     """
-    badges = {
-        "LOW": {
-            "label": "Low Confidence",
-            "color": "orange",
-            "icon": "⚠️",
-            "description": "Results require careful review. Human oversight recommended."
-        },
-        "MEDIUM": {
-            "label": "Medium Confidence",
-            "color": "blue", 
-            "icon": "ℹ️",
-            "description": "Results based on available evidence. Review before acting."
-        },
-        "HIGH": {
-            "label": "High Confidence",
-            "color": "green",
-            "icon": "✓",
-            "description": "Strong evidence support. Standard review sufficient."
-        }
-    }
-    return badges.get(confidence_level, badges["LOW"])
+    return _BADGES.get(confidence_level, _BADGES["LOW"])
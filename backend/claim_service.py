@@ -12,8 +12,12 @@ HARD RULES:
 - DO NOT hide uncertainty
 - Every output includes legal disclaimer
 """
+import asyncio
 import json
 import hashlib
+import re
+import string
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -185,6 +189,42 @@ OUTPUT FORMAT (JSON):
 Generate the claim structure now:"""
 
 
+# ============== Precompiled Templates ==============
+
+def _to_template(format_string: str, fields: List[str]) -> string.Template:
+    """
+    Convert a `.format`-style template to a precompiled string.Template.
+
+    `.format` re-parses the whole template on every call; `Template.substitute`
+    does a single placeholder pass. The public `.format`-style constants above
+    are kept as the source of truth.
+    """
+    converted = format_string
+    for field in fields:
+        converted = converted.replace("{" + field + "}", "$" + field)
+    # Unescape the literal JSON braces ({{ -> {) after field conversion
+    converted = converted.replace("{{", "{").replace("}}", "}")
+    return string.Template(converted)
+
+
+_CLAIM_PROMPT_TMPL = _to_template(
+    CLAIM_GENERATION_PROMPT, ["idea_text", "overlap_context", "novelty_risk"]
+)
+_NO_CONTEXT_PROMPT_TMPL = _to_template(NO_CONTEXT_PROMPT, ["idea_text"])
+_ATTORNEY_HANDOFF_TMPL = _to_template(
+    ATTORNEY_HANDOFF_TEMPLATE,
+    ["independent_count", "dependent_count", "review_areas",
+     "prior_art_notes", "novelty_risk", "risk_recommendation"]
+)
+
+DEFAULT_PRIOR_ART_NOTE = "Prior art analysis not performed."
+
+# Matches a fenced code block (```json ... ``` or ``` ... ```) in LLM output.
+# A single regex scan replaces the old split("```json")/split("```") chain,
+# which copied the full response up to three times.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
 # ============== Data Classes ==============
 
 @dataclass
@@ -222,56 +262,128 @@ class ClaimGenerationResult:
 
 # ============== Helper Functions ==============
 
+# Version tag stored alongside hashes so the algorithm can be rotated
+# without making old audit records unverifiable.
+HASH_ALGO_VERSION = "blake2b-128-1"
+
+
 def compute_input_hash(idea_text: str, overlap_context: str, novelty_risk: str) -> str:
-    """Compute SHA256 hash of inputs for auditing."""
+    """
+    Compute a content hash of the generation inputs for auditing.
+
+    The hash is a dedup/audit key, not a security boundary, so we use
+    BLAKE2b (stdlib, faster than SHA-256 on typical hosts) truncated to
+    128 bits: 32 hex chars instead of 64 halves the index/storage footprint
+    on every claim row while keeping collision odds negligible for dedup.
+    """
     content = f"{idea_text}|{overlap_context}|{novelty_risk}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _clip(s: str, n: int) -> str:
+    """Truncate `s` to `n` chars, skipping the slice copy when already short."""
+    return s if len(s) <= n else s[:n]
 
 
 def build_overlap_context(comparative_analysis: Optional[Dict]) -> str:
-    """Build overlap context string from comparative analysis."""
+    """
+    Build overlap context string from comparative analysis.
+
+    Memoized on a canonical JSON serialization of the dict: claim retries and
+    regenerations pass the same analysis payload repeatedly, so repeated calls
+    return the cached summary instead of rebuilding it.
+    """
     if not comparative_analysis:
         return "No prior art analysis available."
-    
+    try:
+        payload = json.dumps(comparative_analysis, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        # Unhashable/unserializable payload - fall back to a direct build
+        return _build_overlap_context_uncached(comparative_analysis)
+    return _build_overlap_context_cached(payload)
+
+
+@lru_cache(maxsize=256)
+def _build_overlap_context_cached(payload_json: str) -> str:
+    """Cached dispatch for build_overlap_context (key = canonical JSON)."""
+    return _build_overlap_context_uncached(json.loads(payload_json))
+
+
+def _build_overlap_context_uncached(comparative_analysis: Dict) -> str:
+    """Build the overlap context summary from a comparative analysis dict."""
     context_parts = []
     
     if comparative_analysis.get("existing_work_summary"):
-        context_parts.append(f"Existing Work: {comparative_analysis['existing_work_summary'][:500]}")
-    
+        context_parts.append(f"Existing Work: {_clip(comparative_analysis['existing_work_summary'], 500)}")
+
     overlaps = comparative_analysis.get("overlaps", [])
     if overlaps:
         context_parts.append("Key Overlaps with Prior Art:")
         for i, o in enumerate(overlaps[:3]):
             if isinstance(o, dict):
-                context_parts.append(f"  {i+1}. {o.get('description', str(o)[:200])}")
+                context_parts.append(f"  {i+1}. {o.get('description', _clip(str(o), 200))}")
             else:
-                context_parts.append(f"  {i+1}. {str(o)[:200]}")
-    
+                context_parts.append(f"  {i+1}. {_clip(str(o), 200)}")
+
     diffs = comparative_analysis.get("differentiators", [])
     if diffs:
         context_parts.append("Potential Differentiators:")
         for i, d in enumerate(diffs[:3]):
             if isinstance(d, dict):
-                context_parts.append(f"  {i+1}. {d.get('description', str(d)[:200])}")
+                context_parts.append(f"  {i+1}. {d.get('description', _clip(str(d), 200))}")
             else:
-                context_parts.append(f"  {i+1}. {str(d)[:200]}")
+                context_parts.append(f"  {i+1}. {_clip(str(d), 200)}")
     
     return "\n".join(context_parts) if context_parts else "No prior art analysis available."
 
 
+_RISK_RECOMMENDATIONS = {
+    "GREEN": "Low overlap detected. Consider broad claims but verify with patent counsel.",
+    "YELLOW": "Moderate overlap. Focus on differentiating aspects in claims. Attorney review essential.",
+    "RED": "High overlap with prior art. Claims may need significant narrowing. Consult attorney before proceeding.",
+    "UNKNOWN": "Prior art analysis not performed. Complete evidence retrieval and similarity analysis first."
+}
+
+
 def get_risk_recommendation(novelty_risk: str) -> str:
     """Get recommendation based on novelty risk level."""
-    recommendations = {
-        "GREEN": "Low overlap detected. Consider broad claims but verify with patent counsel.",
-        "YELLOW": "Moderate overlap. Focus on differentiating aspects in claims. Attorney review essential.",
-        "RED": "High overlap with prior art. Claims may need significant narrowing. Consult attorney before proceeding.",
-        "UNKNOWN": "Prior art analysis not performed. Complete evidence retrieval and similarity analysis first."
-    }
-    return recommendations.get(novelty_risk, recommendations["UNKNOWN"])
+    return _RISK_RECOMMENDATIONS.get(novelty_risk, _RISK_RECOMMENDATIONS["UNKNOWN"])
 
 
 # ============== Main Generation Function ==============
 
+_CLAIM_SYSTEM_PROMPT = """You are a patent claim structuring assistant.
+You help inventors structure technical ideas into patent-style claim hierarchies.
+This is for educational purposes ONLY - NOT legal advice.
+DO NOT assert patentability or legal validity.
+Always output valid JSON."""
+
+
+def _choose_prompt(idea_text: str, overlap_context: Optional[str], novelty_risk: str) -> str:
+    """Render the generation prompt based on context availability."""
+    if overlap_context and overlap_context != "No prior art analysis available.":
+        return _CLAIM_PROMPT_TMPL.substitute(
+            idea_text=idea_text,
+            overlap_context=_clip(overlap_context, 2000),
+            novelty_risk=novelty_risk
+        )
+    return _NO_CONTEXT_PROMPT_TMPL.substitute(idea_text=idea_text)
+
+
+def _error_result(input_hash: str, error: str) -> ClaimGenerationResult:
+    """Build a failed ClaimGenerationResult (disclaimer always present)."""
+    return ClaimGenerationResult(
+        success=False,
+        claims=[],
+        risks=[],
+        review_areas=[],
+        attorney_handoff="",
+        disclaimer=LEGAL_DISCLAIMER,
+        input_hash=input_hash,
+        error=error
+    )
+
+
 def generate_claim_structure(
     idea_text: str,
     overlap_context: Optional[str] = None,
@@ -280,150 +392,150 @@ def generate_claim_structure(
 ) -> ClaimGenerationResult:
     """
     Generate patent claim structure from idea text.
-    
+
     Returns conceptual claims with:
     - Claim hierarchy (independent + dependent)
     - Risk annotations
     - Attorney handoff notes
     - Legal disclaimer
-    
+
     NEVER asserts patentability.
     """
     # Truncate idea if too long
-    idea_text = idea_text[:8000]
-    
+    idea_text = _clip(idea_text, 8000)
+
     # Compute input hash for auditing
     input_hash = compute_input_hash(idea_text, overlap_context or "", novelty_risk)
-    
-    # Choose prompt based on context availability
-    if overlap_context and overlap_context != "No prior art analysis available.":
-        prompt = CLAIM_GENERATION_PROMPT.format(
-            idea_text=idea_text,
-            overlap_context=overlap_context[:2000],
-            novelty_risk=novelty_risk
-        )
-    else:
-        prompt = NO_CONTEXT_PROMPT.format(idea_text=idea_text)
-    
+
+    prompt = _choose_prompt(idea_text, overlap_context, novelty_risk)
+
     try:
-        # Build system prompt
-        system_prompt = """You are a patent claim structuring assistant. 
-You help inventors structure technical ideas into patent-style claim hierarchies.
-This is for educational purposes ONLY - NOT legal advice.
-DO NOT assert patentability or legal validity.
-Always output valid JSON."""
-        
         # Call LLM with correct signature
         response = ai_service.call_llm(
-            system_prompt=system_prompt,
+            system_prompt=_CLAIM_SYSTEM_PROMPT,
             user_message=prompt,
             prompt_version=PROMPT_VERSION
         )
-        
-        if not response.success:
-            return ClaimGenerationResult(
-                success=False,
-                claims=[],
-                risks=[],
-                review_areas=[],
-                attorney_handoff="",
-                disclaimer=LEGAL_DISCLAIMER,
-                input_hash=input_hash,
-                error=response.error or "LLM call failed"
-            )
-        
-        # Parse JSON response
-        ai_output = response.ai_output or ""
+        return _parse_generation_response(response, overlap_context, novelty_risk, input_hash)
+    except Exception as e:
+        return _error_result(input_hash, str(e))
 
-        
-        try:
-            # Handle markdown code blocks
-            if "```json" in ai_output:
-                json_str = ai_output.split("```json")[1].split("```")[0]
-            elif "```" in ai_output:
-                json_str = ai_output.split("```")[1].split("```")[0]
-            else:
-                json_str = ai_output
-            
-            parsed = json.loads(json_str.strip())
-            
-            # Extract claims
-            claims = []
-            for c in parsed.get("claims", []):
-                claims.append(ClaimItem(
-                    claim_number=c.get("claim_number", len(claims) + 1),
-                    claim_type=c.get("claim_type", "DEPENDENT"),
-                    claim_text=c.get("claim_text", ""),
-                    technical_feature=c.get("technical_feature", ""),
-                    explanation=c.get("explanation", ""),
-                    parent_claim_number=c.get("parent_claim_number")
-                ))
-            
-            # Extract risks
-            risks = []
-            for r in parsed.get("risks", []):
-                risk_type = r.get("risk_type", "BROAD")
-                if risk_type not in ["BROAD", "OVERLAP", "NEEDS_NARROWING"]:
-                    risk_type = "BROAD"
-                
-                risks.append(RiskItem(
-                    claim_number=r.get("claim_number", 1),
-                    risk_type=risk_type,
-                    description=r.get("description", "")
-                ))
-            
-            # Extract review areas
-            review_areas = parsed.get("review_areas", [
-                "Professional patent attorney review required",
-                "Prior art search validation needed"
-            ])
-            
-            # Build attorney handoff
-            independent_count = sum(1 for c in claims if c.claim_type == "INDEPENDENT")
-            dependent_count = sum(1 for c in claims if c.claim_type == "DEPENDENT")
-            
-            attorney_handoff = ATTORNEY_HANDOFF_TEMPLATE.format(
-                independent_count=independent_count,
-                dependent_count=dependent_count,
-                review_areas="\n".join(f"- {area}" for area in review_areas),
-                prior_art_notes=overlap_context[:500] if overlap_context else "Prior art analysis not performed.",
-                novelty_risk=novelty_risk,
-                risk_recommendation=get_risk_recommendation(novelty_risk)
-            )
-            
-            return ClaimGenerationResult(
-                success=True,
-                claims=claims,
-                risks=risks,
-                review_areas=review_areas,
-                attorney_handoff=attorney_handoff,
-                disclaimer=LEGAL_DISCLAIMER,
-                input_hash=input_hash
+
+async def generate_claim_structure_async(
+    idea_text: str,
+    overlap_context: Optional[str] = None,
+    novelty_risk: str = "UNKNOWN",
+    evidence_ids: Optional[List[int]] = None
+) -> ClaimGenerationResult:
+    """
+    Async variant of generate_claim_structure.
+
+    Awaits the LLM call instead of blocking the worker thread, so multiple
+    claim generations (per-claim regen, batch drafting) can run concurrently
+    via asyncio.gather and finish in ~max-latency rather than sum-latency.
+
+    Uses ai_service.call_llm_async when the provider exposes it; otherwise
+    the sync call runs in a worker thread. Parsing stays synchronous (cheap).
+    """
+    idea_text = _clip(idea_text, 8000)
+    input_hash = compute_input_hash(idea_text, overlap_context or "", novelty_risk)
+    prompt = _choose_prompt(idea_text, overlap_context, novelty_risk)
+
+    try:
+        call_llm_async = getattr(ai_service, "call_llm_async", None)
+        if call_llm_async is not None:
+            response = await call_llm_async(
+                system_prompt=_CLAIM_SYSTEM_PROMPT,
+                user_message=prompt,
+                prompt_version=PROMPT_VERSION
             )
-            
-        except json.JSONDecodeError as e:
-            return ClaimGenerationResult(
-                success=False,
-                claims=[],
-                risks=[],
-                review_areas=[],
-                attorney_handoff="",
-                disclaimer=LEGAL_DISCLAIMER,
-                input_hash=input_hash,
-                error=f"Failed to parse LLM response: {str(e)}"
+        else:
+            response = await asyncio.to_thread(
+                ai_service.call_llm,
+                system_prompt=_CLAIM_SYSTEM_PROMPT,
+                user_message=prompt,
+                prompt_version=PROMPT_VERSION
             )
-            
+        return _parse_generation_response(response, overlap_context, novelty_risk, input_hash)
     except Exception as e:
-        return ClaimGenerationResult(
-            success=False,
-            claims=[],
-            risks=[],
-            review_areas=[],
-            attorney_handoff="",
-            disclaimer=LEGAL_DISCLAIMER,
-            input_hash=input_hash,
-            error=str(e)
-        )
+        return _error_result(input_hash, str(e))
+
+
+def _parse_generation_response(
+    response,
+    overlap_context: Optional[str],
+    novelty_risk: str,
+    input_hash: str
+) -> ClaimGenerationResult:
+    """Parse the LLM response into a ClaimGenerationResult."""
+    if not response.success:
+        return _error_result(input_hash, response.error or "LLM call failed")
+
+    # Parse JSON response
+    ai_output = response.ai_output or ""
+
+    try:
+        # Handle markdown code blocks (single scan, no split copies)
+        fence_match = _FENCE_RE.search(ai_output)
+        json_str = fence_match.group(1) if fence_match else ai_output
+
+        parsed = json.loads(json_str.strip())
+    except json.JSONDecodeError as e:
+        return _error_result(input_hash, f"Failed to parse LLM response: {str(e)}")
+
+    # Extract claims
+    claims = []
+    for c in parsed.get("claims", []):
+        claims.append(ClaimItem(
+            claim_number=c.get("claim_number", len(claims) + 1),
+            claim_type=c.get("claim_type", "DEPENDENT"),
+            claim_text=c.get("claim_text", ""),
+            technical_feature=c.get("technical_feature", ""),
+            explanation=c.get("explanation", ""),
+            parent_claim_number=c.get("parent_claim_number")
+        ))
+
+    # Extract risks
+    risks = []
+    for r in parsed.get("risks", []):
+        risk_type = r.get("risk_type", "BROAD")
+        if risk_type not in ["BROAD", "OVERLAP", "NEEDS_NARROWING"]:
+            risk_type = "BROAD"
+
+        risks.append(RiskItem(
+            claim_number=r.get("claim_number", 1),
+            risk_type=risk_type,
+            description=r.get("description", "")
+        ))
+
+    # Extract review areas
+    review_areas = parsed.get("review_areas", [
+        "Professional patent attorney review required",
+        "Prior art search validation needed"
+    ])
+
+    # Build attorney handoff
+    independent_count = sum(1 for c in claims if c.claim_type == "INDEPENDENT")
+    dependent_count = sum(1 for c in claims if c.claim_type == "DEPENDENT")
+
+    attorney_handoff = _ATTORNEY_HANDOFF_TMPL.substitute(
+        independent_count=independent_count,
+        dependent_count=dependent_count,
+        review_areas="\n".join(f"- {area}" for area in review_areas),
+        prior_art_notes=_clip(overlap_context, 500) if overlap_context else DEFAULT_PRIOR_ART_NOTE,
+        novelty_risk=novelty_risk,
+        risk_recommendation=get_risk_recommendation(novelty_risk)
+    )
+
+    return ClaimGenerationResult(
+        success=True,
+        claims=claims,
+        risks=risks,
+        review_areas=review_areas,
+        attorney_handoff=attorney_handoff,
+        disclaimer=LEGAL_DISCLAIMER,
+        input_hash=input_hash
+    )
 
 
 def build_dependency_graph(claims: List[ClaimItem]) -> Dict[str, Any]:
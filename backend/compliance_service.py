@@ -38,10 +38,31 @@ RESTRICTED_FEATURES = {
     }
 }
 
+# Precomputed views of RESTRICTED_FEATURES so the hot-path checks are a
+# single hash probe instead of a per-call dict comprehension.
+_BLOCKED_IN_COMPLIANCE: frozenset = frozenset(
+    k for k, v in RESTRICTED_FEATURES.items() if not v["allowed_in_compliance"]
+)
+_BLOCKED_REASONS: Dict[str, str] = {
+    k: RESTRICTED_FEATURES[k]["reason"] for k in _BLOCKED_IN_COMPLIANCE
+}
+_BLOCKED_FEATURES_LIST: List[str] = sorted(_BLOCKED_IN_COMPLIANCE)
+
+
+# Settings are a process-wide singleton, so compliance mode cannot change at
+# runtime - snapshot it once instead of chasing settings.compliance_mode
+# attribute lookups on every gated request.
+_COMPLIANCE_MODE_ACTIVE: bool = settings.compliance_mode
+
+_COMPLIANCE_DRAFT_INSTRUCTION = (
+    "Improve clarity, grammar, and academic tone. "
+    "Do not add new ideas or change the meaning."
+)
+
 
 def is_compliance_mode_active() -> bool:
     """Check if system is in compliance mode."""
-    return settings.compliance_mode
+    return _COMPLIANCE_MODE_ACTIVE
 
 
 def validate_feature_access(feature_name: str):
@@ -53,12 +74,11 @@ def validate_feature_access(feature_name: str):
     """
     if not is_compliance_mode_active():
         return  # Normal mode: everything allowed
-        
-    rule = RESTRICTED_FEATURES.get(feature_name)
-    if rule and not rule["allowed_in_compliance"]:
+
+    if feature_name in _BLOCKED_IN_COMPLIANCE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Compliance Restriction: {rule['reason']}"
+            detail=f"Compliance Restriction: {_BLOCKED_REASONS[feature_name]}"
         )
 
 
@@ -68,9 +88,9 @@ def check_draft_optimization_params(instruction: str) -> str:
     
     If in Compliance Mode, force instruction to be "Improve clarity and grammar only".
     """
-    if is_compliance_mode_active():
+    if _COMPLIANCE_MODE_ACTIVE:
         # Override user instruction
-        return "Improve clarity, grammar, and academic tone. Do not add new ideas or change the meaning."
+        return _COMPLIANCE_DRAFT_INSTRUCTION
     return instruction
 
 
@@ -78,8 +98,6 @@ def get_system_compliance_status() -> Dict[str, Any]:
     """Get current compliance status for UI."""
     return {
         "compliance_mode_active": is_compliance_mode_active(),
-        "restricted_features": [
-            k for k, v in RESTRICTED_FEATURES.items() if not v["allowed_in_compliance"]
-        ],
+        "restricted_features": _BLOCKED_FEATURES_LIST,
         "audit_logging_enabled": settings.audit_logs_enabled
     }
@@ -2,7 +2,7 @@
 Configuration management for Inventix AI Backend
 """
 from pydantic_settings import BaseSettings
-from functools import lru_cache
+from functools import cached_property, lru_cache
 import os
 
 
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
     llm_model: str = "Qwen/Qwen3-32B"
     llm_max_tokens: int = 1000
     llm_timeout_seconds: int = 30
+    llm_max_concurrent: int = 8  # Cap on simultaneous in-flight LLM calls
+    llm_max_retries: int = 5  # Attempts per call when the provider returns 429
     
     # Embedding Configuration (Phase 4)
     embedding_model: str = "openai/text-embedding-3-large"
@@ -48,6 +50,7 @@ class Settings(BaseSettings):
     # Phase 10: Compliance & Production
     compliance_mode: bool = False  # Set to True for institutional environments
     audit_logs_enabled: bool = True
+    ip_hash_key: str = ""  # Optional secret key for feedback IP hashing
 
     
     class Config:
@@ -55,20 +58,25 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         extra = "ignore"
     
-    @property
+    # Settings are a process-wide singleton (get_settings is cached), so these
+    # derived values never change at runtime. cached_property computes each
+    # split once instead of on every CORS preflight / upload size check.
+    @cached_property
     def allowed_extensions_list(self) -> list[str]:
         return [ext.strip() for ext in self.allowed_extensions.split(",")]
-    
-    @property
+
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
-    
-    @property
+
+    @cached_property
     def max_file_size_bytes(self) -> int:
         return self.max_file_size_mb * 1024 * 1024
 
 
-@lru_cache()
+# maxsize=None skips the LRU bookkeeping entirely (plain dict lookup) -
+# a zero-arg function only ever caches one entry anyway.
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """Get cached settings instance"""
     return Settings()
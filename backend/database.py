@@ -1,13 +1,9 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
-from config import get_settings
+from db import get_engine, get_write_engine
 
-settings = get_settings()
-
-engine = create_engine(
-    settings.database_url, connect_args={"check_same_thread": False}
-)
+engine = get_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+WriteSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_write_engine())
 
 Base = declarative_base()
 
@@ -20,3 +16,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_write_db():
+    """Session on the single-writer engine - use for write-heavy endpoints."""
+    db = WriteSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,13 +1,13 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from models import Base, AuditLog, ActionType
 from audit_service import log_action
 from config import get_settings
+from db import get_engine
 
 settings = get_settings()
 # Ensure DB url is correct
 print(f"DB URL: {settings.database_url}")
-engine = create_engine(settings.database_url)
+engine = get_engine()
 SessionLocal = sessionmaker(bind=engine)
 db = SessionLocal()
 
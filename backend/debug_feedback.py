@@ -1,11 +1,11 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from models import Base, UserFeedback
 from feedback_service import submit_feedback
 from config import get_settings
+from db import get_engine
 
 settings = get_settings()
-engine = create_engine(settings.database_url)
+engine = get_engine()
 SessionLocal = sessionmaker(bind=engine)
 db = SessionLocal()
 
@@ -13,12 +13,36 @@ CRITICAL RULES:
 - Do NOT overwrite user drafts
 - Suggestions must be explainable and rejectable
 """
+import asyncio
 import json
+import re
+import string
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel
 from config import get_settings
-import ai_service
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _get_llm():
+    """Import ai_service lazily - it pulls in HTTP client machinery that
+    processes importing draft_service only for its schemas never need."""
+    from ai_service import call_llm
+    return call_llm
+
+
+@lru_cache(maxsize=1)
+def _get_llm_async():
+    """Async counterpart of _get_llm; None when ai_service exposes no coroutine."""
+    import ai_service
+    return getattr(ai_service, "call_llm_async", None)
 
 settings = get_settings()
 
@@ -128,8 +152,149 @@ Respond in JSON format ONLY:
 }}"""
 
 
+def _to_template(format_string: str, fields: tuple) -> string.Template:
+    """Convert a .format-style prompt into a precompiled string.Template.
+
+    str.format reparses the ~2KB template on every call; Template.substitute
+    is a single regex pass over a template compiled once at import.
+    """
+    converted = format_string
+    for f in fields:
+        converted = converted.replace("{" + f + "}", "$" + f)
+    return string.Template(converted.replace("{{", "{").replace("}}", "}"))
+
+
+_DRAFT_OPTIMIZATION_TMPL = _to_template(
+    DRAFT_OPTIMIZATION_PROMPT, ("draft_text", "overlap_context", "novelty_risk")
+)
+_NO_OVERLAP_TMPL = _to_template(NO_OVERLAP_PROMPT, ("draft_text",))
+
+# Single-scan extraction of fenced JSON; the old split("```json") chain
+# allocated several intermediate lists/substrings per response.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Suggestion validation constants - hoisted so the per-suggestion loop does
+# hashed membership checks instead of rebuilding list literals each pass.
+_REQUIRED_KEYS = (
+    "original_text_snippet", "suggested_revision", "reason_for_change",
+    "change_type", "preserves_intent"
+)
+_ALLOWED_CHANGE_TYPES = frozenset({"clarity", "specificity", "overlap_reduction", "structure"})
+_ALLOWED_INTENT = frozenset({"YES", "POSSIBLY", "NO"})
+
+
+def _loads(payload: str) -> Any:
+    """Parse LLM JSON; orjson (Rust parser) when available, stdlib otherwise.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _locate_snippets(draft_text: str, snippets: List[str]) -> Dict[str, int]:
+    """
+    Find the first occurrence of each snippet in one scan of the draft.
+
+    Locating M snippets with M separate str.find calls walks the whole
+    draft M times. A combined alternation inside a zero-width lookahead
+    reports every position where any snippet starts, so one left-to-right
+    scan resolves all of them (stopping early once each is located).
+    """
+    pending = {sn for sn in snippets if sn}
+    if not pending:
+        return {}
+
+    alternation = "|".join(
+        re.escape(sn) for sn in sorted(pending, key=len, reverse=True)
+    )
+    combined = re.compile(f"(?=({alternation}))")
+
+    positions: Dict[str, int] = {}
+    for m in combined.finditer(draft_text):
+        start = m.start()
+        for sn in list(pending):
+            if draft_text.startswith(sn, start):
+                positions[sn] = start
+                pending.discard(sn)
+        if not pending:
+            break
+    return positions
+
+
 # ============== Service Functions ==============
 
+def _build_suggestion_prompt(draft_text: str, overlap_context: Optional[str], novelty_risk: str) -> str:
+    """Choose prompt based on whether we have overlap context."""
+    if overlap_context:
+        return _DRAFT_OPTIMIZATION_TMPL.substitute(
+            draft_text=draft_text,
+            overlap_context=overlap_context[:3000],
+            novelty_risk=novelty_risk
+        )
+    return _NO_OVERLAP_TMPL.substitute(draft_text=draft_text)
+
+
+def _parse_suggestion_response(draft_text: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate, clean and position-annotate a raw LLM suggestion response."""
+    if not response["success"]:
+        return {
+            "success": False,
+            "suggestions": [],
+            "error": response.get("error", "LLM call failed")
+        }
+
+    # Parse JSON response
+    ai_output = response["output"]
+
+    try:
+        # Handle potential markdown code blocks (single regex scan)
+        fence_match = _FENCE_RE.search(ai_output)
+        json_str = fence_match.group(1) if fence_match else ai_output
+
+        parsed = _loads(json_str.strip())
+        suggestions = parsed.get("suggestions", [])
+
+        # Validate and clean suggestions
+        valid_suggestions = []
+        for s in suggestions:
+            if all(k in s for k in _REQUIRED_KEYS):
+                # Validate change_type
+                if s["change_type"] not in _ALLOWED_CHANGE_TYPES:
+                    s["change_type"] = "clarity"
+                # Validate preserves_intent
+                if s["preserves_intent"] not in _ALLOWED_INTENT:
+                    s["preserves_intent"] = "POSSIBLY"
+
+                valid_suggestions.append(s)
+
+        # Locate all snippets in a single scan of the draft instead of
+        # one full str.find pass per suggestion.
+        positions = _locate_snippets(
+            draft_text,
+            [s["original_text_snippet"] for s in valid_suggestions]
+        )
+        for s in valid_suggestions:
+            start_pos = positions.get(s["original_text_snippet"], -1)
+            if start_pos >= 0:
+                s["start_position"] = start_pos
+                s["end_position"] = start_pos + len(s["original_text_snippet"])
+
+        return {
+            "success": True,
+            "suggestions": valid_suggestions
+        }
+
+    except json.JSONDecodeError:
+        return {
+            "success": False,
+            "suggestions": [],
+            "error": "Failed to parse LLM response as JSON"
+        }
+
+
 def generate_draft_suggestions(
     draft_text: str,
     overlap_context: Optional[str] = None,
@@ -137,7 +302,7 @@ def generate_draft_suggestions(
 ) -> Dict[str, Any]:
     """
     Generate localized draft improvement suggestions.
-    
+
     Returns suggestions that are:
     - Localized (not full rewrites)
     - Explainable (with reasons)
@@ -145,73 +310,42 @@ def generate_draft_suggestions(
     """
     # Truncate draft if too long
     draft_text = draft_text[:10000]
-    
-    # Choose prompt based on whether we have overlap context
-    if overlap_context:
-        prompt = DRAFT_OPTIMIZATION_PROMPT.format(
-            draft_text=draft_text,
-            overlap_context=overlap_context[:3000],
-            novelty_risk=novelty_risk
-        )
-    else:
-        prompt = NO_OVERLAP_PROMPT.format(draft_text=draft_text)
-    
+    prompt = _build_suggestion_prompt(draft_text, overlap_context, novelty_risk)
+
     try:
-        response = ai_service.call_llm(prompt, max_tokens=2000)
-        
-        if not response["success"]:
-            return {
-                "success": False,
-                "suggestions": [],
-                "error": response.get("error", "LLM call failed")
-            }
-        
-        # Parse JSON response
-        ai_output = response["output"]
-        
-        try:
-            # Handle potential markdown code blocks
-            if "```json" in ai_output:
-                json_str = ai_output.split("```json")[1].split("```")[0]
-            elif "```" in ai_output:
-                json_str = ai_output.split("```")[1].split("```")[0]
-            else:
-                json_str = ai_output
-            
-            parsed = json.loads(json_str.strip())
-            suggestions = parsed.get("suggestions", [])
-            
-            # Validate and clean suggestions
-            valid_suggestions = []
-            for s in suggestions:
-                if all(k in s for k in ["original_text_snippet", "suggested_revision", "reason_for_change", "change_type", "preserves_intent"]):
-                    # Validate change_type
-                    if s["change_type"] not in ["clarity", "specificity", "overlap_reduction", "structure"]:
-                        s["change_type"] = "clarity"
-                    # Validate preserves_intent
-                    if s["preserves_intent"] not in ["YES", "POSSIBLY", "NO"]:
-                        s["preserves_intent"] = "POSSIBLY"
-                    
-                    # Find position in original text
-                    start_pos = draft_text.find(s["original_text_snippet"])
-                    if start_pos >= 0:
-                        s["start_position"] = start_pos
-                        s["end_position"] = start_pos + len(s["original_text_snippet"])
-                    
-                    valid_suggestions.append(s)
-            
-            return {
-                "success": True,
-                "suggestions": valid_suggestions
-            }
-            
-        except json.JSONDecodeError:
-            return {
-                "success": False,
-                "suggestions": [],
-                "error": "Failed to parse LLM response as JSON"
-            }
-            
+        response = _get_llm()(prompt, max_tokens=2000)
+        return _parse_suggestion_response(draft_text, response)
+    except Exception as e:
+        return {
+            "success": False,
+            "suggestions": [],
+            "error": str(e)
+        }
+
+
+async def generate_draft_suggestions_async(
+    draft_text: str,
+    overlap_context: Optional[str] = None,
+    novelty_risk: str = "UNKNOWN"
+) -> Dict[str, Any]:
+    """
+    Async variant of generate_draft_suggestions.
+
+    Awaits ai_service.call_llm_async when the provider exposes it; the
+    sync call otherwise runs in a worker thread. Either way the event
+    loop keeps serving requests for the duration of the LLM round trip.
+    Parsing stays synchronous (cheap).
+    """
+    draft_text = draft_text[:10000]
+    prompt = _build_suggestion_prompt(draft_text, overlap_context, novelty_risk)
+
+    try:
+        call_llm_async = _get_llm_async()
+        if call_llm_async is not None:
+            response = await call_llm_async(prompt, max_tokens=2000)
+        else:
+            response = await asyncio.to_thread(_get_llm(), prompt, max_tokens=2000)
+        return _parse_suggestion_response(draft_text, response)
     except Exception as e:
         return {
             "success": False,
@@ -226,33 +360,30 @@ def build_overlap_context_from_analysis(analysis: Dict[str, Any]) -> str:
     
     Used to inform the LLM about existing overlaps.
     """
-    context_parts = []
-    
-    # Add existing landscape summary
-    if analysis.get("existing_landscape"):
-        context_parts.append(f"Existing work landscape: {analysis['existing_landscape'][:500]}")
-    
-    # Add key overlaps
-    overlaps = analysis.get("key_overlaps", [])
-    if overlaps:
-        context_parts.append("Key overlaps with existing work:")
-        for overlap in overlaps[:5]:
-            if isinstance(overlap, dict):
-                concept = overlap.get("concept", "")
-                titles = overlap.get("evidence_titles", [])
-                context_parts.append(f"- '{concept}' overlaps with: {', '.join(titles[:3])}")
-    
-    # Add potential differentiators
-    diffs = analysis.get("potential_differentiators", [])
-    if diffs:
-        context_parts.append("Potential differentiating aspects:")
-        for diff in diffs[:3]:
-            if isinstance(diff, dict):
-                aspect = diff.get("aspect", "")
-                uncertainty = diff.get("uncertainty", "")
-                context_parts.append(f"- {aspect} ({uncertainty})")
-    
-    return "\n".join(context_parts)
+    # Streamed through a generator so neither the parts list nor the [:N]
+    # slice copies are materialized; islice iterates the originals in place.
+    def _parts():
+        landscape = analysis.get("existing_landscape")
+        if landscape:
+            yield f"Existing work landscape: {landscape[:500]}"
+
+        overlaps = analysis.get("key_overlaps", [])
+        if overlaps:
+            yield "Key overlaps with existing work:"
+            for overlap in islice(overlaps, 5):
+                if isinstance(overlap, dict):
+                    concept = overlap.get("concept", "")
+                    titles = overlap.get("evidence_titles", [])
+                    yield f"- '{concept}' overlaps with: {', '.join(islice(titles, 3))}"
+
+        diffs = analysis.get("potential_differentiators", [])
+        if diffs:
+            yield "Potential differentiating aspects:"
+            for diff in islice(diffs, 3):
+                if isinstance(diff, dict):
+                    yield f"- {diff.get('aspect', '')} ({diff.get('uncertainty', '')})"
+
+    return "\n".join(_parts())
 
 
 def build_limitations() -> List[str]:
@@ -9,11 +9,11 @@ HARD RULES:
 - Preserve disagreement - no smoothing
 - Full audit trail
 """
-import json
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from sqlalchemy import case, distinct, func
 from sqlalchemy.orm import Session
 
 from models import UserFeedback, FeedbackType, OutputType
@@ -23,10 +23,29 @@ settings = get_settings()
 
 FEEDBACK_SERVICE_VERSION = "1.0.0"
 
+# Value -> member lookups for validation. A dict get avoids the
+# exception-driven Enum(value) path on every submission (same pattern as
+# audit_service._ACTION_BY_VALUE).
+_FEEDBACK_BY_VALUE = {t.value: t for t in FeedbackType}
+_OUTPUT_BY_VALUE = {t.value: t for t in OutputType}
+
 
 # ============== Data Classes ==============
 
-@dataclass
+@dataclass(slots=True)
+class FeedbackPayload:
+    """One feedback entry for batch submission."""
+    output_id: str
+    output_type: str
+    project_id: int
+    feedback_type: str
+    user_id: Optional[str] = None
+    user_role: Optional[str] = None
+    comment: Optional[str] = None
+    ip_address: Optional[str] = None
+
+
+@dataclass(slots=True)
 class FeedbackSubmission:
     """Feedback submission result."""
     success: bool
@@ -37,7 +56,7 @@ class FeedbackSubmission:
     timestamp: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackSummary:
     """Aggregated feedback summary."""
     output_id: str
@@ -52,7 +71,7 @@ class FeedbackSummary:
     comments: List[str]
 
 
-@dataclass  
+@dataclass(slots=True)
 class ProjectFeedbackStats:
     """Project-level feedback statistics."""
     project_id: int
@@ -66,10 +85,21 @@ class ProjectFeedbackStats:
 # ============== Helper Functions ==============
 
 def hash_ip(ip_address: Optional[str]) -> Optional[str]:
-    """Hash IP address for abuse prevention without storing raw IP."""
+    """
+    Hash IP address for abuse prevention without storing raw IP.
+
+    BLAKE2b with a 16-byte digest is ~3x faster than SHA-256 and produces
+    the 32 hex chars we store directly (no truncation waste). When
+    settings.ip_hash_key is set, keyed hashing also defeats rainbow-table
+    lookups of the small IPv4 space.
+    """
     if not ip_address:
         return None
-    return hashlib.sha256(ip_address.encode()).hexdigest()[:32]
+    return hashlib.blake2b(
+        ip_address.encode(),
+        digest_size=16,
+        key=settings.ip_hash_key.encode()
+    ).hexdigest()
 
 
 def calculate_disagreement_rate(
@@ -91,6 +121,103 @@ def calculate_disagreement_rate(
 
 # ============== Core Functions ==============
 
+def _failed_submission(
+    payload: FeedbackPayload,
+    message: str,
+    timestamp: Optional[str] = None
+) -> FeedbackSubmission:
+    """Build a failure result for one payload.
+
+    Pass a shared `timestamp` when reporting several failures from one call
+    so the isoformat string is built once, not per entry.
+    """
+    return FeedbackSubmission(
+        success=False,
+        feedback_id=0,
+        output_id=payload.output_id,
+        feedback_type=payload.feedback_type,
+        message=message,
+        timestamp=timestamp or datetime.utcnow().isoformat()
+    )
+
+
+def submit_feedback_batch(
+    db: Session,
+    submissions: List[FeedbackPayload]
+) -> List[FeedbackSubmission]:
+    """
+    Submit a batch of feedback entries in ONE transaction.
+
+    A reviewer rating N outputs in a burst previously paid one commit
+    (one fsync) per entry; here all valid entries share a single commit.
+    Invalid entries get failure results without blocking the rest.
+
+    NEVER alters the original AI outputs.
+    """
+    results: List[Optional[FeedbackSubmission]] = [None] * len(submissions)
+    records: List[UserFeedback] = []
+    record_slots: List[int] = []
+    fail_ts: Optional[str] = None  # built lazily, shared across failures
+
+    for i, payload in enumerate(submissions):
+        # Validate types (dict lookups, no exception on the hot path)
+        fb_type = _FEEDBACK_BY_VALUE.get(payload.feedback_type)
+        if fb_type is None:
+            fail_ts = fail_ts or datetime.utcnow().isoformat()
+            results[i] = _failed_submission(
+                payload, f"Invalid feedback type: {payload.feedback_type}", fail_ts
+            )
+            continue
+
+        out_type = _OUTPUT_BY_VALUE.get(payload.output_type)
+        if out_type is None:
+            fail_ts = fail_ts or datetime.utcnow().isoformat()
+            results[i] = _failed_submission(
+                payload, f"Invalid output type: {payload.output_type}", fail_ts
+            )
+            continue
+
+        records.append(UserFeedback(
+            output_id=payload.output_id,
+            output_type=out_type,
+            project_id=payload.project_id,
+            user_id=payload.user_id,
+            user_role=payload.user_role,
+            feedback_type=fb_type,
+            comment=payload.comment,
+            ip_hash=hash_ip(payload.ip_address)
+        ))
+        record_slots.append(i)
+
+    if records:
+        try:
+            db.add_all(records)
+            # Flush assigns ids; capture id/created_at before commit expires
+            # attributes so no per-row refresh SELECT is needed.
+            db.flush()
+            captured = [(r.id, r.created_at) for r in records]
+            db.commit()
+            for slot, (feedback_id, created_at) in zip(record_slots, captured):
+                payload = submissions[slot]
+                results[slot] = FeedbackSubmission(
+                    success=True,
+                    feedback_id=feedback_id,
+                    output_id=payload.output_id,
+                    feedback_type=payload.feedback_type,
+                    message="Feedback recorded successfully. Thank you for helping improve the system.",
+                    timestamp=created_at.isoformat()
+                )
+        except Exception as e:
+            db.rollback()
+            error_ts = datetime.utcnow().isoformat()
+            for slot in record_slots:
+                results[slot] = _failed_submission(
+                    submissions[slot], f"Failed to record feedback: {str(e)}", error_ts
+                )
+
+    return results
+
+
 def submit_feedback(
     db: Session,
     output_id: str,
@@ -104,72 +231,20 @@ def submit_feedback(
 ) -> FeedbackSubmission:
     """
     Submit feedback on an AI output.
-    
+
     NEVER alters the original AI output.
     Just stores the feedback for audit and calibration.
     """
-    try:
-        # Validate feedback type
-        try:
-            fb_type = FeedbackType(feedback_type)
-        except ValueError:
-            return FeedbackSubmission(
-                success=False,
-                feedback_id=0,
-                output_id=output_id,
-                feedback_type=feedback_type,
-                message=f"Invalid feedback type: {feedback_type}",
-                timestamp=datetime.utcnow().isoformat()
-            )
-        
-        # Validate output type
-        try:
-            out_type = OutputType(output_type)
-        except ValueError:
-            return FeedbackSubmission(
-                success=False,
-                feedback_id=0,
-                output_id=output_id,
-                feedback_type=feedback_type,
-                message=f"Invalid output type: {output_type}",
-                timestamp=datetime.utcnow().isoformat()
-            )
-        
-        # Create feedback record
-        feedback = UserFeedback(
-            output_id=output_id,
-            output_type=out_type,
-            project_id=project_id,
-            user_id=user_id,
-            user_role=user_role,
-            feedback_type=fb_type,
-            comment=comment,
-            ip_hash=hash_ip(ip_address)
-        )
-        
-        db.add(feedback)
-        db.commit()
-        db.refresh(feedback)
-        
-        return FeedbackSubmission(
-            success=True,
-            feedback_id=feedback.id,
-            output_id=output_id,
-            feedback_type=feedback_type,
-            message="Feedback recorded successfully. Thank you for helping improve the system.",
-            timestamp=feedback.created_at.isoformat()
-        )
-        
-    except Exception as e:
-        db.rollback()
-        return FeedbackSubmission(
-            success=False,
-            feedback_id=0,
-            output_id=output_id,
-            feedback_type=feedback_type,
-            message=f"Failed to record feedback: {str(e)}",
-            timestamp=datetime.utcnow().isoformat()
-        )
+    return submit_feedback_batch(db, [FeedbackPayload(
+        output_id=output_id,
+        output_type=output_type,
+        project_id=project_id,
+        feedback_type=feedback_type,
+        user_id=user_id,
+        user_role=user_role,
+        comment=comment,
+        ip_address=ip_address
+    )])[0]
 
 
 def get_feedback_for_output(
@@ -181,22 +256,33 @@ def get_feedback_for_output(
     
     Returns aggregated summary with counts and comments.
     """
-    feedback_list = db.query(UserFeedback).filter(
+    # Push the counting into the database: one grouped aggregate returns at
+    # most one row per feedback type instead of hydrating every row just to
+    # count it in Python.
+    counts = dict(db.query(
+        UserFeedback.feedback_type, func.count()
+    ).filter(
         UserFeedback.output_id == output_id
-    ).order_by(UserFeedback.created_at.desc()).all()
-    
-    helpful = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.HELPFUL)
-    not_helpful = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.NOT_HELPFUL)
-    agree = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.AGREE)
-    disagree = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.DISAGREE)
-    needs_revision = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.NEEDS_REVISION)
-    needs_expert = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.NEEDS_EXPERT)
-    
-    comments = [f.comment for f in feedback_list if f.comment]
-    
+    ).group_by(UserFeedback.feedback_type).all())
+
+    helpful = counts.get(FeedbackType.HELPFUL, 0)
+    not_helpful = counts.get(FeedbackType.NOT_HELPFUL, 0)
+    agree = counts.get(FeedbackType.AGREE, 0)
+    disagree = counts.get(FeedbackType.DISAGREE, 0)
+    needs_revision = counts.get(FeedbackType.NEEDS_REVISION, 0)
+    needs_expert = counts.get(FeedbackType.NEEDS_EXPERT, 0)
+
+    # Only the 10 most recent comments are ever shown - fetch exactly those.
+    comments = [
+        comment for (comment,) in db.query(UserFeedback.comment).filter(
+            UserFeedback.output_id == output_id,
+            UserFeedback.comment.isnot(None)
+        ).order_by(UserFeedback.created_at.desc()).limit(10).all()
+    ]
+
     return FeedbackSummary(
         output_id=output_id,
-        total_count=len(feedback_list),
+        total_count=sum(counts.values()),
         helpful_count=helpful,
         not_helpful_count=not_helpful,
         agree_count=agree,
@@ -204,7 +290,7 @@ def get_feedback_for_output(
         needs_revision_count=needs_revision,
         needs_expert_count=needs_expert,
         disagreement_rate=calculate_disagreement_rate(disagree, agree, not_helpful, helpful),
-        comments=comments[:10]  # Limit to most recent 10
+        comments=comments
     )
 
 
@@ -217,23 +303,24 @@ def get_project_feedback(
     
     Returns project-level statistics and recent feedback.
     """
-    feedback_list = db.query(UserFeedback).filter(
-        UserFeedback.project_id == project_id
-    ).order_by(UserFeedback.created_at.desc()).all()
-    
-    # Unique outputs rated
-    unique_outputs = set(f.output_id for f in feedback_list)
-    
-    # Count disagreements
+    # All four numbers come from one server-side aggregate; only the 10 rows
+    # actually shown are hydrated. Previously every feedback row for the
+    # project was loaded just to be counted.
     disagree_types = {FeedbackType.DISAGREE, FeedbackType.NOT_HELPFUL, FeedbackType.NEEDS_REVISION}
-    disagreements = sum(1 for f in feedback_list if f.feedback_type in disagree_types)
-    
-    # Disagreement rate
-    disagreement_rate = disagreements / len(feedback_list) if feedback_list else 0.0
-    
-    # Outputs needing review
-    needs_review = sum(1 for f in feedback_list if f.feedback_type == FeedbackType.NEEDS_EXPERT)
-    
+
+    total, unique_outputs, disagreements, needs_review = db.query(
+        func.count(),
+        func.count(distinct(UserFeedback.output_id)),
+        func.coalesce(
+            func.sum(case((UserFeedback.feedback_type.in_(disagree_types), 1), else_=0)), 0
+        ),
+        func.coalesce(
+            func.sum(case((UserFeedback.feedback_type == FeedbackType.NEEDS_EXPERT, 1), else_=0)), 0
+        )
+    ).filter(UserFeedback.project_id == project_id).one()
+
+    disagreement_rate = disagreements / total if total else 0.0
+
     # Recent feedback (last 10)
     recent = [
         {
@@ -244,13 +331,15 @@ def get_project_feedback(
             "comment": f.comment,
             "timestamp": f.created_at.isoformat()
         }
-        for f in feedback_list[:10]
+        for f in db.query(UserFeedback).filter(
+            UserFeedback.project_id == project_id
+        ).order_by(UserFeedback.created_at.desc()).limit(10).all()
     ]
-    
+
     return ProjectFeedbackStats(
         project_id=project_id,
-        total_feedback=len(feedback_list),
-        total_outputs_rated=len(unique_outputs),
+        total_feedback=total,
+        total_outputs_rated=unique_outputs,
         overall_disagreement_rate=round(disagreement_rate, 3),
         outputs_needing_review=needs_review,
         recent_feedback=recent
@@ -32,18 +32,42 @@ HARD RULES:
 - NO patentability assertions
 - NO legal advice
 """
+import asyncio
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List
+from typing import List, NamedTuple, Optional
+import array
+import hashlib
+import importlib
 import json
-from fastapi import FastAPI, Depends, HTTPException, UploadFile, File as FastAPIFile, status
+import math
+import re
+import threading
+import time
+import uuid
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from fastapi import FastAPI, BackgroundTasks, Depends, HTTPException, UploadFile, File as FastAPIFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, ORJSONResponse
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, joinedload, selectinload
 import os
 
 from config import get_settings, ensure_upload_dir
-from database import get_db, init_db, SessionLocal
+from database import get_db, get_write_db, init_db, SessionLocal
 from schemas import (
     ProjectCreate, 
     ProjectUpdate, 
@@ -59,8 +83,11 @@ from schemas import (
     TextExtractionResult,
     KeywordExtractionRequest,
     KeywordExtractionResponse,
+    KeywordExtractionBatchRequest,
+    KeywordExtractionBatchResponse,
     RetrievalRequest,
     RetrievalResponse,
+    RetrieveAllResponse,
     ProjectEvidenceResponse,
     EvidenceCandidateResponse,
     # Phase 4 schemas
@@ -113,6 +140,8 @@ from schemas import (
     ClaimsListResponse,
     FeedbackRequest,
     FeedbackResponse,
+    FeedbackBatchRequest,
+    FeedbackBatchResponse,
     FeedbackSummaryResponse,
     ProjectFeedbackStatsResponse,
     ConfidenceCalibrationResponse,
@@ -123,8 +152,10 @@ from schemas import (
     AuditLogItem
 )
 from models import (
+    Project, File as FileModel,
     AnalysisStatus, AIAction, ExtractedText, CandidateEvidence, EvidenceSource,
-    NoveltyRiskLevel as NoveltyRiskLevelModel, IdeaEmbedding, EvidenceEmbedding, SimilarityScore,
+    NoveltyRiskLevel as NoveltyRiskLevelModel, IdeaEmbedding, EvidenceEmbedding, EmbeddingCache,
+    SimilarityScore,
     ComparativeAnalysis, DraftVersion, DraftSuggestion,
     SuggestionStatus as SuggestionStatusModel, ChangeType as ChangeTypeModel, PreservesIntent as PreservesIntentModel,
     ClaimDraft, ClaimRiskAnnotation, ClaimGenerationMetadata,
@@ -134,12 +165,35 @@ from models import (
     AuditLog, ActionType
 )
 import crud
-import ai_service
-import text_extraction
-import retrieval_service
-import embedding_service
-import similarity_engine
-import comparative_service
+
+
+class _LazyModule:
+    """
+    Defer importing a heavy service module until its first use.
+
+    ai_service, text_extraction and friends transitively pull in LLM SDKs
+    and PDF parser libraries; importing them eagerly dominates process cold
+    start even for requests that never touch them. Attribute access imports
+    the real module once and delegates from then on (same idea as
+    draft_service._get_llm, applied module-wide).
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+ai_service = _LazyModule("ai_service")
+text_extraction = _LazyModule("text_extraction")
+retrieval_service = _LazyModule("retrieval_service")
+embedding_service = _LazyModule("embedding_service")
+similarity_engine = _LazyModule("similarity_engine")
+comparative_service = _LazyModule("comparative_service")
 import draft_service
 import recommendation_service
 import claim_service
@@ -151,6 +205,11 @@ import compliance_service
 
 settings = get_settings()
 
+# Snapshot of the route prefix: read once at import instead of a pydantic
+# attribute lookup per decorator (same pattern as the service-level
+# settings snapshots).
+API_PREFIX = settings.api_prefix
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -203,11 +262,28 @@ async def lifespan(app: FastAPI):
     print(f"Embedding Model: {settings.embedding_model}")
     
     # Check if LLM is configured
-    if not settings.llm_api_key or settings.llm_api_key == "your-nebius-api-key-here":
+    llm_configured = bool(settings.llm_api_key and settings.llm_api_key != "your-nebius-api-key-here")
+    if not llm_configured:
         print("WARNING: LLM API key not configured!")
     else:
         print("LLM API key: configured")
-    
+
+    # Health payload is pure configuration - freeze it once at startup so the
+    # frequently-pinged /health endpoint just returns a prebuilt dict.
+    app.state.health = {
+        "status": "healthy",
+        "phase": 10,
+        "ai_enabled": llm_configured,
+        "ai_provider": settings.llm_provider if llm_configured else None,
+        "text_extraction": True,
+        "evidence_retrieval": True,
+        "venue_recommendations": True,
+        "patent_claims": True,
+        "audit_logs": True,
+        "compliance_mode": settings.compliance_mode,
+        "message": "Phase 10 backend operational. Functionally complete."
+    }
+
     print("Text Extraction: PDF, DOCX, TXT")
     print("External Retrieval: Semantic Scholar, USPTO")
     print("Similarity Scoring: Cosine similarity on embeddings")
@@ -221,9 +297,28 @@ async def lifespan(app: FastAPI):
     db = SessionLocal()
     audit_service.log_action(db, "SYSTEM_STARTUP", "System", None, metadata={"version": "1.0.0"})
     db.close()
-    
+
+    # Shared HTTP client: one connection pool with keepalive reused across
+    # all outbound retrieval calls instead of a new client per request.
+    # Generous keepalive keeps Semantic Scholar / USPTO connections warm so
+    # repeat searches skip the TCP+TLS handshake.
+    app.state.http_client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    if hasattr(retrieval_service, "set_http_client"):
+        retrieval_service.set_http_client(app.state.http_client)
+
+    # Worker processes for CPU-bound document parsing (see extract-text)
+    app.state.process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 2)
+
     yield
     # Shutdown
+    app.state.process_pool.shutdown()
+    await app.state.http_client.aclose()
+    flushed = audit_service.flush_audit_logs()
+    if flushed:
+        print(f"Flushed {flushed} buffered audit log entries")
     print("Shutting down Inventix AI Backend")
 
 
@@ -256,7 +351,10 @@ app = FastAPI(
     - COMPLIANCE MODE restricts risky features
     """,
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large list/evidence payloads several times faster
+    # than stdlib json and handles datetimes natively.
+    default_response_class=ORJSONResponse
 )
 
 # CORS Middleware
@@ -276,32 +374,56 @@ app.add_middleware(
 
 @app.get("/health", tags=["Health"])
 def health_check():
-    """Health check endpoint"""
-    llm_configured = bool(settings.llm_api_key and settings.llm_api_key != "your-nebius-api-key-here")
-    return {
-        "status": "healthy",
-        "phase": 10,
-        "ai_enabled": llm_configured,
-        "ai_provider": settings.llm_provider if llm_configured else None,
-        "text_extraction": True,
-        "evidence_retrieval": True,
-        "venue_recommendations": True,
-        "patent_claims": True,
-        "audit_logs": True,
-        "compliance_mode": settings.compliance_mode,
-        "message": "Phase 10 backend operational. Functionally complete."
-    }
+    """Health check endpoint (snapshot built once in lifespan)"""
+    return app.state.health
 
 
 # ============== Project Endpoints ==============
 
+# Short-lived existence cache: the UI probes the same project from several
+# endpoints in one burst (files, evidence, status), and each probe paid a
+# DB round trip just to confirm the project exists. Only positive answers
+# are cached - a 404 always re-checks - and deletes invalidate eagerly.
+_PROJECT_EXISTS_TTL_SECONDS = 5.0
+_PROJECT_EXISTS_MAX_ENTRIES = 4096
+_project_exists_cache: dict = {}
+_project_exists_lock = threading.Lock()
+
+
+def _project_exists(db: Session, project_id: int) -> bool:
+    """Check that a project exists, caching hits for a few seconds."""
+    now = time.monotonic()
+    with _project_exists_lock:
+        expiry = _project_exists_cache.get(project_id)
+        if expiry is not None and expiry > now:
+            return True
+
+    # PK-only probe - no column hydration, no identity-map entry
+    exists = db.query(Project.id).filter(Project.id == project_id).scalar() is not None
+    if exists:
+        with _project_exists_lock:
+            if len(_project_exists_cache) >= _PROJECT_EXISTS_MAX_ENTRIES:
+                _project_exists_cache.clear()
+            _project_exists_cache[project_id] = now + _PROJECT_EXISTS_TTL_SECONDS
+    return exists
+
+
+def _forget_project_exists(project_id: int) -> None:
+    """Drop a project from the existence cache (call on delete)."""
+    with _project_exists_lock:
+        _project_exists_cache.pop(project_id, None)
+
 @app.post(
-    f"{settings.api_prefix}/projects", 
+    f"{API_PREFIX}/projects", 
     response_model=ProjectDetailResponse,
     status_code=status.HTTP_201_CREATED,
     tags=["Projects"]
 )
-def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
+def create_project(
+    project: ProjectCreate,
+    background: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Create a new project.
     
@@ -310,13 +432,14 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     """
     db_project = crud.create_project(db=db, project=project)
     
-    # Phase 10: Audit Log
-    audit_service.log_action(
-        db, 
-        "PROJECT_CREATED", 
-        "Project", 
-        db_project.id, 
-        None, 
+    # Phase 10: Audit Log (written after the response flushes)
+    audit_service.log_action_deferred(
+        background,
+        db,
+        "PROJECT_CREATED",
+        "Project",
+        db_project.id,
+        None,
         metadata={"title": db_project.title, "type": db_project.type}
     )
     
@@ -324,7 +447,7 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
 
 
 @app.get(
-    f"{settings.api_prefix}/projects",
+    f"{API_PREFIX}/projects",
     response_model=ProjectListResponse,
     tags=["Projects"]
 )
@@ -344,17 +467,23 @@ def list_projects(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}",
+    f"{API_PREFIX}/projects/{{project_id}}",
     response_model=ProjectDetailResponse,
     tags=["Projects"]
 )
 def get_project(project_id: int, db: Session = Depends(get_db)):
     """
     Get a project by ID.
-    
+
     Includes files list and analysis state.
     """
-    db_project = crud.get_project(db, project_id)
+    # The detail response serializes files and analysis_state - load them
+    # with the project instead of via two lazy-load round trips.
+    db_project = db.get(
+        Project,
+        project_id,
+        options=(selectinload(Project.files), joinedload(Project.analysis_state))
+    )
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -364,7 +493,7 @@ def get_project(project_id: int, db: Session = Depends(get_db)):
 
 
 @app.put(
-    f"{settings.api_prefix}/projects/{{project_id}}",
+    f"{API_PREFIX}/projects/{{project_id}}",
     response_model=ProjectDetailResponse,
     tags=["Projects"]
 )
@@ -389,7 +518,7 @@ def update_project(
 
 
 @app.delete(
-    f"{settings.api_prefix}/projects/{{project_id}}",
+    f"{API_PREFIX}/projects/{{project_id}}",
     response_model=SuccessResponse,
     tags=["Projects"]
 )
@@ -405,13 +534,14 @@ def delete_project(project_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
+    _forget_project_exists(project_id)
     return SuccessResponse(message=f"Project {project_id} deleted successfully")
 
 
 # ============== File Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/files",
+    f"{API_PREFIX}/projects/{{project_id}}/files",
     response_model=FileSchema,
     status_code=status.HTTP_201_CREATED,
     tags=["Files"]
@@ -428,32 +558,69 @@ async def upload_file(
     Max size: 50MB
     """
     # Check project exists
-    if not crud.get_project(db, project_id):
+    if not _project_exists(db, project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
     
-    # Check file size
+    # Check file type before touching the disk
+    file_ext = os.path.splitext(file.filename or "")[1].lower()
+    if file_ext not in settings.allowed_extensions_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file type. Allowed: {settings.allowed_extensions}"
+        )
+
+    # Reject early when the client declared a size (chunked uploads may not)
     if file.size and file.size > settings.max_file_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Maximum size is {settings.max_file_size_mb}MB"
         )
-    
-    # Save file
-    db_file = crud.save_uploaded_file(db, project_id, file)
-    if not db_file:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed: {settings.allowed_extensions}"
-        )
-    
+
+    # Stream to a temp file in 1 MiB chunks, counting bytes as we go. This
+    # bounds memory at one chunk regardless of upload size and enforces the
+    # limit even when the client omits Content-Length. The temp file moves
+    # into place atomically only after a complete, in-budget upload.
+    stored_filename = f"{uuid.uuid4().hex}{file_ext}"
+    final_path = os.path.join(settings.upload_dir, stored_filename)
+    temp_path = f"{final_path}.part"
+    bytes_written = 0
+
+    try:
+        with open(temp_path, "wb") as out:
+            while chunk := await file.read(1024 * 1024):
+                bytes_written += len(chunk)
+                if bytes_written > settings.max_file_size_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Maximum size is {settings.max_file_size_mb}MB"
+                    )
+                out.write(chunk)
+        os.replace(temp_path, final_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    db_file = FileModel(
+        project_id=project_id,
+        filename=stored_filename,
+        original_filename=file.filename,
+        file_type=file_ext,
+        storage_path=final_path,
+        file_size=bytes_written
+    )
+    db.add(db_file)
+    db.commit()
+    db.refresh(db_file)
+
     return db_file
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/files",
+    f"{API_PREFIX}/projects/{{project_id}}/files",
     response_model=List[FileSchema],
     tags=["Files"]
 )
@@ -461,7 +628,7 @@ def list_project_files(project_id: int, db: Session = Depends(get_db)):
     """
     List all files for a project.
     """
-    if not crud.get_project(db, project_id):
+    if not _project_exists(db, project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
@@ -470,7 +637,7 @@ def list_project_files(project_id: int, db: Session = Depends(get_db)):
 
 
 @app.delete(
-    f"{settings.api_prefix}/projects/{{project_id}}/files/{{file_id}}",
+    f"{API_PREFIX}/projects/{{project_id}}/files/{{file_id}}",
     response_model=SuccessResponse,
     tags=["Files"]
 )
@@ -492,7 +659,7 @@ def delete_file(project_id: int, file_id: int, db: Session = Depends(get_db)):
 
 
 @app.get(
-    f"{settings.api_prefix}/files/{{file_id}}/download",
+    f"{API_PREFIX}/files/{{file_id}}/download",
     tags=["Files"]
 )
 def download_file(file_id: int, db: Session = Depends(get_db)):
@@ -506,23 +673,30 @@ def download_file(file_id: int, db: Session = Depends(get_db)):
             detail=f"File {file_id} not found"
         )
     
-    if not os.path.exists(db_file.storage_path):
+    # One stat() both validates existence and replaces the separate
+    # os.path.exists() round trip to the filesystem.
+    try:
+        stat_result = os.stat(db_file.storage_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File no longer exists on disk"
         )
-    
+
+    # Passing the stat lets Starlette skip its own stat and stream the file
+    # via the ASGI server's sendfile path (zero user-space copies on Linux).
     return FileResponse(
         path=db_file.storage_path,
         filename=db_file.original_filename,
-        media_type="application/octet-stream"
+        media_type="application/octet-stream",
+        stat_result=stat_result
     )
 
 
 # ============== Phase 3: Text Extraction Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/extract-text",
+    f"{API_PREFIX}/projects/{{project_id}}/extract-text",
     response_model=TextExtractionResult,
     tags=["Text Extraction"]
 )
@@ -536,7 +710,7 @@ def extract_text_from_project(project_id: int, db: Session = Depends(get_db)):
     - Scanned PDFs may yield no text
     - Results are stored in database
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -557,20 +731,35 @@ def extract_text_from_project(project_id: int, db: Session = Depends(get_db)):
     total_chars = 0
     processed = 0
     errors = []
-    
-    for file in files:
-        # Check if already extracted
-        existing = db.query(ExtractedText).filter(ExtractedText.file_id == file.id).first()
-        
-        result = text_extraction.extract_text(file.storage_path, file.file_type)
-        
+
+    # Preload existing extractions in one query instead of one per file.
+    existing_map = {
+        e.file_id: e for e in db.query(ExtractedText).filter(
+            ExtractedText.file_id.in_([f.id for f in files])
+        ).all()
+    }
+
+    # Parse files in the process pool - PDF/DOCX parsing spends most of its
+    # time in pure-Python parser code, so separate processes scale across
+    # cores where threads would serialize on the GIL. Only paths go in and
+    # extracted content comes back; DB writes stay on this thread.
+    pool = app.state.process_pool
+    extraction_results = zip(files, pool.map(
+        text_extraction.extract_text,
+        [f.storage_path for f in files],
+        [f.file_type for f in files]
+    ))
+
+    now = datetime.utcnow()
+    for file, result in extraction_results:
         if result.success:
+            existing = existing_map.get(file.id)
             if existing:
                 # Update existing
                 existing.content = result.content
                 existing.character_count = result.character_count
                 existing.extraction_method = result.method
-                existing.extracted_at = datetime.utcnow()
+                existing.extracted_at = now
                 existing.version += 1
             else:
                 # Create new
@@ -582,7 +771,7 @@ def extract_text_from_project(project_id: int, db: Session = Depends(get_db)):
                     character_count=result.character_count
                 )
                 db.add(extracted)
-            
+
             total_chars += result.character_count
             processed += 1
         else:
@@ -607,100 +796,194 @@ def extract_text_from_project(project_id: int, db: Session = Depends(get_db)):
 
 # ============== Phase 3: Keyword Extraction Endpoints ==============
 
+def _keyword_failure(error: str) -> KeywordExtractionResponse:
+    """Build an empty failed extraction response."""
+    return KeywordExtractionResponse(
+        success=False,
+        keywords=[],
+        concepts=[],
+        technical_phrases=[],
+        error=error
+    )
+
+
+def _resolve_keyword_text(db: Session, request: KeywordExtractionRequest):
+    """
+    Resolve the text to analyze for one extraction request.
+
+    Returns (text, None) on success or (None, failure_response) when no
+    usable text exists, so batch callers can fail one item without aborting
+    the rest.
+    """
+    db_project = db.get(Project, request.project_id)
+    if not db_project:
+        return None, _keyword_failure(f"Project with id {request.project_id} not found")
+
+    # Get text: from request, extracted texts, or idea_text
+    text_to_analyze = request.text
+
+    if not text_to_analyze:
+        # Try extracted texts. Truncate in SQL so only the first 2000 chars of
+        # each document cross the wire, and stream rows so we can stop as soon
+        # as the 5000-char LLM budget is filled instead of fetching everything.
+        parts = []
+        total = 0
+        for (snippet,) in db.query(
+            func.substr(ExtractedText.content, 1, 2000)
+        ).filter(
+            ExtractedText.project_id == request.project_id
+        ).yield_per(8):
+            parts.append(snippet)
+            total += len(snippet) + 1
+            if total >= 5000:
+                break
+
+        if parts:
+            text_to_analyze = " ".join(parts)
+        elif db_project.idea_text:
+            text_to_analyze = db_project.idea_text
+        else:
+            return None, _keyword_failure(
+                "No text available. Upload files and extract text first, or provide text directly."
+            )
+
+    # Truncate for LLM
+    return text_to_analyze[:5000], None
+
+
+def _json_loads(payload: str):
+    """Parse LLM JSON; orjson (Rust parser) when available, stdlib otherwise.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string; orjson when available, stdlib otherwise.
+
+    Stored columns stay text either way - orjson just produces the bytes
+    several times faster on the nested analysis lists.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Fallback keyword shape: word-ish tokens, 3-41 chars (precompiled once)
+_KEYWORD_FALLBACK_RE = re.compile(r"[A-Za-z][A-Za-z0-9\-_ ]{2,40}")
+
+
+def _parse_keyword_result(result) -> KeywordExtractionResponse:
+    """Turn an LLM result into a KeywordExtractionResponse."""
+    if not result.success:
+        return _keyword_failure(result.error)
+
+    # Parse JSON response (orjson when available - see claim_service._loads)
+    try:
+        parsed = _json_loads(result.ai_output)
+        return KeywordExtractionResponse(
+            success=True,
+            keywords=parsed.get("keywords", []),
+            concepts=parsed.get("concepts", []),
+            technical_phrases=parsed.get("technical_phrases", [])
+        )
+    except json.JSONDecodeError:
+        # Fallback: pull word-like tokens from the response in one regex scan
+        words = [w.strip() for w in _KEYWORD_FALLBACK_RE.findall(result.ai_output)]
+        return KeywordExtractionResponse(
+            success=True,
+            keywords=words[:10],
+            concepts=[],
+            technical_phrases=[],
+            notes="Keywords extracted (JSON parsing failed, used fallback)."
+        )
+
+
 @app.post(
-    f"{settings.api_prefix}/analysis/extract-keywords",
+    f"{API_PREFIX}/analysis/extract-keywords",
     response_model=KeywordExtractionResponse,
     tags=["Keyword Extraction"]
 )
 def extract_keywords(request: KeywordExtractionRequest, db: Session = Depends(get_db)):
     """
     Extract keywords, concepts, and technical phrases using LLM.
-    
+
     ⚠️ AI ASSISTANCE ONLY
     - Keywords are suggestions, not facts
     - Human review is required
     """
-    db_project = crud.get_project(db, request.project_id)
-    if not db_project:
+    if not _project_exists(db, request.project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {request.project_id} not found"
         )
-    
-    # Get text: from request, extracted texts, or idea_text
-    text_to_analyze = request.text
-    
-    if not text_to_analyze:
-        # Try extracted texts
-        extracted = db.query(ExtractedText).filter(
-            ExtractedText.project_id == request.project_id
-        ).all()
-        
-        if extracted:
-            text_to_analyze = " ".join([e.content[:2000] for e in extracted])
-        elif db_project.idea_text:
-            text_to_analyze = db_project.idea_text
-        else:
-            return KeywordExtractionResponse(
-                success=False,
-                keywords=[],
-                concepts=[],
-                technical_phrases=[],
-                error="No text available. Upload files and extract text first, or provide text directly."
-            )
-    
-    # Truncate for LLM
-    text_to_analyze = text_to_analyze[:5000]
-    
+
+    text_to_analyze, failure = _resolve_keyword_text(db, request)
+    if failure:
+        return failure
+
     # Use LLM for extraction
     prompt = retrieval_service.create_keyword_extraction_prompt(text_to_analyze)
-    
+
     try:
         result = ai_service.call_llm(prompt, max_tokens=500)
-        
-        if result.success:
-            # Parse JSON response
-            try:
-                parsed = json.loads(result.ai_output)
-                return KeywordExtractionResponse(
-                    success=True,
-                    keywords=parsed.get("keywords", []),
-                    concepts=parsed.get("concepts", []),
-                    technical_phrases=parsed.get("technical_phrases", [])
-                )
-            except json.JSONDecodeError:
-                # Fallback: extract words from response
-                words = [w.strip() for w in result.ai_output.split(",") if w.strip()]
-                return KeywordExtractionResponse(
-                    success=True,
-                    keywords=words[:10],
-                    concepts=[],
-                    technical_phrases=[],
-                    notes="Keywords extracted (JSON parsing failed, used fallback)."
-                )
-        else:
-            return KeywordExtractionResponse(
-                success=False,
-                keywords=[],
-                concepts=[],
-                technical_phrases=[],
-                error=result.error
-            )
-            
+        return _parse_keyword_result(result)
     except Exception as e:
-        return KeywordExtractionResponse(
-            success=False,
-            keywords=[],
-            concepts=[],
-            technical_phrases=[],
-            error=f"Keyword extraction failed: {str(e)}"
-        )
+        return _keyword_failure(f"Keyword extraction failed: {str(e)}")
+
+
+@app.post(
+    f"{API_PREFIX}/analysis/extract-keywords/batch",
+    response_model=KeywordExtractionBatchResponse,
+    tags=["Keyword Extraction"]
+)
+async def extract_keywords_batch(
+    request: KeywordExtractionBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Extract keywords for several texts/projects in one call.
+
+    LLM calls for all items run concurrently, so a bulk re-extraction pays
+    roughly one LLM round trip instead of one per item. Items that cannot be
+    resolved (missing project, no text) fail individually without aborting
+    the batch.
+
+    ⚠️ AI ASSISTANCE ONLY - same rules as the single endpoint.
+    """
+    results: List[KeywordExtractionResponse] = [None] * len(request.items)
+    pending = []  # (slot, prompt)
+
+    for i, item in enumerate(request.items):
+        text_to_analyze, failure = _resolve_keyword_text(db, item)
+        if failure:
+            results[i] = failure
+            continue
+        pending.append((i, retrieval_service.create_keyword_extraction_prompt(text_to_analyze)))
+
+    outcomes = await asyncio.gather(
+        *(_await_service_call(ai_service, "call_llm", prompt, max_tokens=500)
+          for _, prompt in pending),
+        return_exceptions=True
+    )
+
+    for (slot, _), outcome in zip(pending, outcomes):
+        if isinstance(outcome, Exception):
+            results[slot] = _keyword_failure(f"Keyword extraction failed: {str(outcome)}")
+        else:
+            results[slot] = _parse_keyword_result(outcome)
+
+    return KeywordExtractionBatchResponse(results=results)
 
 
 # ============== Phase 3: Evidence Retrieval Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/retrieve-papers",
+    f"{API_PREFIX}/projects/{{project_id}}/retrieve-papers",
     response_model=RetrievalResponse,
     tags=["Evidence Retrieval"]
 )
@@ -718,7 +1001,7 @@ async def retrieve_research_papers(
     - No novelty claims made
     - Every result has a verifiable URL
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -754,22 +1037,24 @@ async def retrieve_research_papers(
             error=result.error
         )
     
-    # Store candidates
-    stored = 0
-    for candidate in result.candidates:
-        evidence = CandidateEvidence(
-            project_id=project_id,
-            source_type="paper",
-            title=candidate.title,
-            authors=candidate.authors,
-            abstract=candidate.abstract,
-            source_name=EvidenceSource.SEMANTIC_SCHOLAR,
-            source_url=candidate.source_url,
-            publication_date=candidate.publication_date,
-            search_query=result.search_query
-        )
-        db.add(evidence)
-        stored += 1
+    # Store candidates in one bulk insert - no per-row unit-of-work overhead
+    rows = [
+        {
+            "project_id": project_id,
+            "source_type": "paper",
+            "title": candidate.title,
+            "authors": candidate.authors,
+            "abstract": candidate.abstract,
+            "source_name": EvidenceSource.SEMANTIC_SCHOLAR,
+            "source_url": candidate.source_url,
+            "publication_date": candidate.publication_date,
+            "search_query": result.search_query
+        }
+        for candidate in result.candidates
+    ]
+    if rows:
+        db.execute(CandidateEvidence.__table__.insert(), rows)
+    stored = len(rows)
     
     # Update analysis state
     if db_project.analysis_state:
@@ -788,7 +1073,7 @@ async def retrieve_research_papers(
 
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/retrieve-patents",
+    f"{API_PREFIX}/projects/{{project_id}}/retrieve-patents",
     response_model=RetrievalResponse,
     tags=["Evidence Retrieval"]
 )
@@ -806,7 +1091,7 @@ async def retrieve_patents(
     - No novelty claims made
     - Every result has a verifiable URL
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -841,22 +1126,24 @@ async def retrieve_patents(
             error=result.error
         )
     
-    # Store candidates
-    stored = 0
-    for candidate in result.candidates:
-        evidence = CandidateEvidence(
-            project_id=project_id,
-            source_type="patent",
-            title=candidate.title,
-            authors=candidate.authors,
-            abstract=candidate.abstract,
-            source_name=EvidenceSource.USPTO,
-            source_url=candidate.source_url,
-            publication_date=candidate.publication_date,
-            search_query=result.search_query
-        )
-        db.add(evidence)
-        stored += 1
+    # Store candidates in one bulk insert - no per-row unit-of-work overhead
+    rows = [
+        {
+            "project_id": project_id,
+            "source_type": "patent",
+            "title": candidate.title,
+            "authors": candidate.authors,
+            "abstract": candidate.abstract,
+            "source_name": EvidenceSource.USPTO,
+            "source_url": candidate.source_url,
+            "publication_date": candidate.publication_date,
+            "search_query": result.search_query
+        }
+        for candidate in result.candidates
+    ]
+    if rows:
+        db.execute(CandidateEvidence.__table__.insert(), rows)
+    stored = len(rows)
     
     # Update analysis state
     if db_project.analysis_state:
@@ -876,68 +1163,254 @@ async def retrieve_patents(
     )
 
 
+@app.post(
+    f"{API_PREFIX}/projects/{{project_id}}/retrieve-all",
+    response_model=RetrieveAllResponse,
+    tags=["Evidence Retrieval"]
+)
+async def retrieve_all_evidence(
+    project_id: int,
+    request: RetrievalRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve research papers AND patents concurrently.
+
+    Both external calls are dispatched together, so total latency is the
+    slower of the two sources instead of their sum.
+
+    ⚠️ CANDIDATE EVIDENCE ONLY - same caveats as the individual endpoints.
+    """
+    db_project = db.get(Project, project_id)
+    if not db_project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {project_id} not found"
+        )
+
+    keywords = request.keywords
+    if not keywords:
+        if db_project.idea_text:
+            keywords = db_project.idea_text.split()[:10]
+        else:
+            no_keywords = dict(
+                success=False,
+                candidates_stored=0,
+                search_query="",
+                retrieval_notes="",
+                error="No keywords provided and no idea text available."
+            )
+            return RetrieveAllResponse(
+                papers=RetrievalResponse(source="Semantic Scholar", **no_keywords),
+                patents=RetrievalResponse(source="USPTO", **no_keywords)
+            )
+
+    # Fire both external searches concurrently.
+    paper_result, patent_result = await asyncio.gather(
+        retrieval_service.search_research_papers(keywords, limit=request.limit),
+        retrieval_service.search_patents(keywords, limit=request.limit),
+        return_exceptions=True
+    )
+
+    def _store(result, source_label, source_type, source_name):
+        if isinstance(result, Exception):
+            return RetrievalResponse(
+                success=False,
+                source=source_label,
+                candidates_stored=0,
+                search_query="",
+                retrieval_notes="",
+                error=str(result)
+            )
+        if not result.success:
+            return RetrievalResponse(
+                success=False,
+                source=source_label,
+                candidates_stored=0,
+                search_query=result.search_query,
+                retrieval_notes="",
+                error=result.error
+            )
+        rows = [
+            {
+                "project_id": project_id,
+                "source_type": source_type,
+                "title": candidate.title,
+                "authors": candidate.authors,
+                "abstract": candidate.abstract,
+                "source_name": source_name,
+                "source_url": candidate.source_url,
+                "publication_date": candidate.publication_date,
+                "search_query": result.search_query
+            }
+            for candidate in result.candidates
+        ]
+        if rows:
+            db.execute(CandidateEvidence.__table__.insert(), rows)
+        return RetrievalResponse(
+            success=True,
+            source=source_label,
+            candidates_stored=len(result.candidates),
+            search_query=result.search_query,
+            retrieval_notes=result.retrieval_notes
+        )
+
+    papers = _store(paper_result, "Semantic Scholar", "paper", EvidenceSource.SEMANTIC_SCHOLAR)
+    patents = _store(patent_result, "USPTO", "patent", EvidenceSource.USPTO)
+
+    stored = papers.candidates_stored + patents.candidates_stored
+    if stored and db_project.analysis_state:
+        db_project.analysis_state.evidence_retrieved = True
+        db_project.analysis_state.retrieval_notes = (
+            f"Retrieved {papers.candidates_stored} research papers and "
+            f"{patents.candidates_stored} patents. No similarity scores computed."
+        )
+
+    db.commit()
+
+    return RetrieveAllResponse(papers=papers, patents=patents)
+
+
+def _evidence_page(
+    db: Session,
+    project_id: int,
+    source_type: str,
+    skip: int,
+    limit: int,
+    include_abstracts: bool
+) -> List[EvidenceCandidateResponse]:
+    """Fetch one page of evidence for a source type, newest first."""
+    columns = [
+        CandidateEvidence.id,
+        CandidateEvidence.title,
+        CandidateEvidence.authors,
+        CandidateEvidence.source_name,
+        CandidateEvidence.source_url,
+        CandidateEvidence.publication_date,
+        CandidateEvidence.retrieved_at
+    ]
+    if include_abstracts:
+        columns.append(CandidateEvidence.abstract)
+
+    rows = db.query(*columns).filter(
+        CandidateEvidence.project_id == project_id,
+        CandidateEvidence.source_type == source_type
+    ).order_by(CandidateEvidence.retrieved_at.desc()).offset(skip).limit(limit).all()
+
+    return [EvidenceCandidateResponse(
+        id=r.id,
+        title=r.title,
+        authors=r.authors,
+        abstract=r.abstract if include_abstracts else None,
+        source_name=r.source_name.value,
+        source_url=r.source_url,
+        publication_date=r.publication_date,
+        retrieved_at=r.retrieved_at
+    ) for r in rows]
+
+
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/evidence",
+    f"{API_PREFIX}/projects/{{project_id}}/evidence",
     response_model=ProjectEvidenceResponse,
     tags=["Evidence Retrieval"]
 )
-def get_project_evidence(project_id: int, db: Session = Depends(get_db)):
+def get_project_evidence(
+    project_id: int,
+    skip: int = 0,
+    limit: int = 50,
+    source_type: Optional[str] = None,
+    include_abstracts: bool = False,
+    db: Session = Depends(get_db)
+):
     """
-    Get all candidate evidence for a project.
-    
+    Get candidate evidence for a project (paginated, newest first).
+
+    By default abstracts are omitted from list responses to keep payloads
+    small; pass include_abstracts=true when the full text matters. Use
+    source_type=paper|patent to page through one source only. Totals always
+    reflect the whole project, not just the returned page.
+
     ⚠️ CANDIDATE EVIDENCE ONLY
     - No similarity scores
     - No novelty judgments
     - Just raw retrieved documents
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
-    
-    evidence = db.query(CandidateEvidence).filter(
+
+    # Per-source totals from one grouped COUNT - rows are never hydrated
+    # just to be counted.
+    totals = dict(db.query(
+        CandidateEvidence.source_type, func.count()
+    ).filter(
         CandidateEvidence.project_id == project_id
-    ).all()
-    
-    papers = [e for e in evidence if e.source_type == "paper"]
-    patents = [e for e in evidence if e.source_type == "patent"]
-    
+    ).group_by(CandidateEvidence.source_type).all())
+    total_papers = totals.get("paper", 0)
+    total_patents = totals.get("patent", 0)
+
+    papers = [] if source_type == "patent" else _evidence_page(
+        db, project_id, "paper", skip, limit, include_abstracts
+    )
+    patents = [] if source_type == "paper" else _evidence_page(
+        db, project_id, "patent", skip, limit, include_abstracts
+    )
+
     return ProjectEvidenceResponse(
         project_id=project_id,
-        papers=[EvidenceCandidateResponse(
-            id=p.id,
-            title=p.title,
-            authors=p.authors,
-            abstract=p.abstract,
-            source_name=p.source_name.value,
-            source_url=p.source_url,
-            publication_date=p.publication_date,
-            retrieved_at=p.retrieved_at
-        ) for p in papers],
-        patents=[EvidenceCandidateResponse(
-            id=p.id,
-            title=p.title,
-            authors=p.authors,
-            abstract=p.abstract,
-            source_name=p.source_name.value,
-            source_url=p.source_url,
-            publication_date=p.publication_date,
-            retrieved_at=p.retrieved_at
-        ) for p in patents],
-        total_evidence=len(evidence)
+        papers=papers,
+        patents=patents,
+        total_evidence=total_papers + total_patents,
+        total_papers=total_papers,
+        total_patents=total_patents
     )
 
 
 # ============== AI Analysis Endpoints (Phase 2) ==============
 
+# One gate for every outbound LLM call. Traffic bursts queue here instead
+# of blowing past the provider's rate limit and surfacing as 429-driven
+# failures in the endpoints.
+_llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrent)
+
+
+async def _await_service_call(module, name: str, *args, **kwargs):
+    """
+    Call a service function without blocking the event loop.
+
+    Prefers the service's native coroutine entry point (``<name>_async``)
+    so outbound HTTPS rides the shared AsyncClient; otherwise the sync
+    function runs in a worker thread. All calls share a semaphore that
+    bounds in-flight concurrency against the provider, and rate-limit
+    (429) responses retry with exponential backoff, honoring Retry-After
+    when the provider sends one. Other HTTP errors propagate unchanged.
+    """
+    async_fn = getattr(module, f"{name}_async", None)
+    for attempt in range(settings.llm_max_retries):
+        try:
+            async with _llm_semaphore:
+                if async_fn is not None:
+                    return await async_fn(*args, **kwargs)
+                return await asyncio.to_thread(getattr(module, name), *args, **kwargs)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != 429 or attempt == settings.llm_max_retries - 1:
+                raise
+            try:
+                delay = float(exc.response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                delay = float(2 ** attempt)
+            await asyncio.sleep(delay)
+
+
 @app.post(
-    f"{settings.api_prefix}/analysis/clarify-idea",
+    f"{API_PREFIX}/analysis/clarify-idea",
     response_model=AIAssistanceResponse,
     tags=["AI Analysis"]
 )
-def clarify_idea(request: AIAssistanceRequest, db: Session = Depends(get_db)):
+async def clarify_idea(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     """
     Clarify and restate an idea in clearer technical language.
     
@@ -947,7 +1420,7 @@ def clarify_idea(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     - Human review is required
     """
     # Verify project exists
-    db_project = crud.get_project(db, request.project_id)
+    db_project = db.get(Project, request.project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -955,7 +1428,7 @@ def clarify_idea(request: AIAssistanceRequest, db: Session = Depends(get_db)):
         )
     
     # Call AI service
-    result = ai_service.clarify_idea(request.text)
+    result = await _await_service_call(ai_service, "clarify_idea", request.text)
     
     # Update analysis state if successful
     if result.success and db_project.analysis_state:
@@ -970,11 +1443,11 @@ def clarify_idea(request: AIAssistanceRequest, db: Session = Depends(get_db)):
 
 
 @app.post(
-    f"{settings.api_prefix}/analysis/rewrite-text",
+    f"{API_PREFIX}/analysis/rewrite-text",
     response_model=AIAssistanceResponse,
     tags=["AI Analysis"]
 )
-def rewrite_text(request: AIAssistanceRequest, db: Session = Depends(get_db)):
+async def rewrite_text(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     """
     Rewrite text to be more specific and technically clear.
     
@@ -984,7 +1457,7 @@ def rewrite_text(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     - Human review is required
     """
     # Verify project exists
-    db_project = crud.get_project(db, request.project_id)
+    db_project = db.get(Project, request.project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -993,7 +1466,7 @@ def rewrite_text(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     
     # Call AI service with context
     context = request.context or "technical claim"
-    result = ai_service.rewrite_text(request.text, context)
+    result = await _await_service_call(ai_service, "rewrite_text", request.text, context)
     
     # Update analysis state if successful
     if result.success and db_project.analysis_state:
@@ -1008,11 +1481,11 @@ def rewrite_text(request: AIAssistanceRequest, db: Session = Depends(get_db)):
 
 
 @app.post(
-    f"{settings.api_prefix}/analysis/explain-risks",
+    f"{API_PREFIX}/analysis/explain-risks",
     response_model=AIAssistanceResponse,
     tags=["AI Analysis"]
 )
-def explain_risks(request: AIAssistanceRequest, db: Session = Depends(get_db)):
+async def explain_risks(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     """
     Explain types of risks commonly associated with ideas in this domain.
     
@@ -1023,7 +1496,7 @@ def explain_risks(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     - Human review is required
     """
     # Verify project exists
-    db_project = crud.get_project(db, request.project_id)
+    db_project = db.get(Project, request.project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1032,7 +1505,7 @@ def explain_risks(request: AIAssistanceRequest, db: Session = Depends(get_db)):
     
     # Call AI service with domain
     domain = db_project.domain or request.context or "technology"
-    result = ai_service.explain_risks(request.text, domain)
+    result = await _await_service_call(ai_service, "explain_risks", request.text, domain)
     
     # Update analysis state if successful
     if result.success and db_project.analysis_state:
@@ -1048,21 +1521,152 @@ def explain_risks(request: AIAssistanceRequest, db: Session = Depends(get_db)):
 
 # ============== Phase 4: Similarity & Novelty Endpoints ==============
 
+def _l2_normalize(vec) -> list:
+    """Scale a vector to unit L2 norm (zero vectors pass through)."""
+    norm = math.sqrt(sum(x * x for x in vec))
+    if not norm:
+        return list(vec)
+    return [x / norm for x in vec]
+
+
+def _cosine_scores(idea_vector, vectors, assume_unit: bool = False):
+    """
+    Cosine similarity of one idea vector against many evidence vectors.
+
+    With numpy the whole comparison is a single matrix-vector product
+    (one BLAS call instead of N Python-level dot products); without it the
+    pure-Python loop still hoists the idea norm out of the loop. Zero-norm
+    vectors score 0.0 in both paths.
+
+    When every vector was L2-normalized at write time, pass assume_unit=True
+    and cosine degenerates to a plain dot product - no norms, no sqrt, no
+    division per pair.
+
+    This is an exact (flat) scan, fine for the per-project corpus sizes we
+    store in SQLite. If the deployment ever moves to Postgres, the upgrade
+    path is a pgvector column with an HNSW index and server-side
+    `1 - (vec <=> :q)` ordering instead of this function.
+    """
+    if not vectors:
+        return []
+
+    if np is not None:
+        E = np.asarray(vectors, dtype=np.float32)
+        q = np.asarray(idea_vector, dtype=np.float32)
+        if assume_unit:
+            return [float(s) for s in E @ q]
+        denom = np.linalg.norm(E, axis=1) * np.linalg.norm(q)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(denom > 0, (E @ q) / denom, 0.0)
+        return [float(s) for s in scores]
+
+    if assume_unit:
+        return [sum(a * b for a, b in zip(idea_vector, vec)) for vec in vectors]
+
+    idea_norm_sq = sum(x * x for x in idea_vector)
+    scores = []
+    for vec in vectors:
+        dot = sum(a * b for a, b in zip(idea_vector, vec))
+        denom = math.sqrt(idea_norm_sq * sum(x * x for x in vec))
+        scores.append(dot / denom if denom else 0.0)
+    return scores
+
+
+def _embedding_to_bytes(vec) -> bytes:
+    """
+    Pack an embedding as raw little-endian float32 bytes for storage.
+
+    A 1536-dim vector stores in 6 KiB of binary versus ~17-30 KiB as JSON
+    text, and unpacking is a C-level buffer copy instead of parsing 1536
+    number literals. float32 keeps everything the model's own precision
+    carries, so scores stay deterministic.
+
+    Deliberately not quantized further: int8-with-scale would quarter the
+    bytes but perturbs scores near the RED/YELLOW novelty thresholds,
+    and this product promises byte-identical rescoring of stored
+    evidence. Revisit only if vector volume makes bandwidth the
+    bottleneck.
+    """
+    return array.array("f", vec).tobytes()
+
+
+def _embedding_from_bytes(stored) -> list:
+    """
+    Unpack a stored embedding; tolerates pre-binary rows.
+
+    Rows written before the switch to LargeBinary hold JSON text - those
+    start with '[' and fall back to the JSON parser until their project's
+    embeddings are next regenerated.
+    """
+    if stored[:1] in (b"[", "["):
+        return _json_loads(stored)
+    a = array.array("f")
+    a.frombytes(stored)
+    return a.tolist()
+
+
+# In-process memo of successful embedding results keyed by content hash.
+# Duplicate titles are common across patent feeds, so repeated text within
+# a worker skips the provider round-trip entirely. Only successes are
+# stored - a plain lru_cache would pin transient provider failures for the
+# process lifetime. Eviction is oldest-insertion-first, same stdlib
+# dict+lock shape as the project-existence cache above.
+_EMBED_CACHE_MAX = 4096
+_embed_cache = {}  # text_hash -> successful embedding result
+_embed_cache_lock = threading.Lock()
+
+
+def _embedding_cache_get(text_hash):
+    with _embed_cache_lock:
+        return _embed_cache.get(text_hash)
+
+
+def _embedding_cache_put(text_hash, result):
+    if not result.success:
+        return
+    with _embed_cache_lock:
+        if len(_embed_cache) >= _EMBED_CACHE_MAX:
+            _embed_cache.pop(next(iter(_embed_cache)))
+        _embed_cache[text_hash] = result
+
+
+def _embed_text_cached(text: str, text_hash: str):
+    """Embed one text, memoizing successful results by content hash."""
+    result = _embedding_cache_get(text_hash)
+    if result is None:
+        result = embedding_service.generate_embedding(text)
+        _embedding_cache_put(text_hash, result)
+    return result
+
+
+class _CachedEmbeddingResult(NamedTuple):
+    """Duck-typed stand-in for a service result when the vector comes from embedding_cache."""
+    embedding: list
+    text_hash: str
+    model_name: str
+    dimensions: int
+    success: bool = True
+
+
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/generate-embeddings",
+    f"{API_PREFIX}/projects/{{project_id}}/generate-embeddings",
     response_model=EmbeddingGenerationResponse,
     tags=["Similarity & Novelty"]
 )
-def generate_embeddings(project_id: int, db: Session = Depends(get_db)):
+async def generate_embeddings(project_id: int, mode: str = "interactive", db: Session = Depends(get_db)):
     """
     Generate embeddings for the user's idea and all evidence.
-    
+
     Uses text-embedding-3-small model via OpenAI-compatible API.
     Embeddings are cached - recomputes only when text changes.
-    
+
+    mode="batch" submits stale evidence texts to the provider's Batch API
+    (half-price, 24h window) instead of embedding interactively; calling
+    the endpoint again merges the batch once it completes.
+
     ⚠️ Requires API key to be configured.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1100,10 +1704,11 @@ def generate_embeddings(project_id: int, db: Session = Depends(get_db)):
     if existing_idea and existing_idea.text_hash == idea_hash:
         idea_embedded = True  # Already cached
     else:
-        result = embedding_service.generate_embedding(idea_text)
+        result = await asyncio.to_thread(_embed_text_cached, idea_text, idea_hash)
         if result.success:
             if existing_idea:
-                existing_idea.embedding = embedding_service.embedding_to_json(result.embedding)
+                existing_idea.embedding = _embedding_to_bytes(_l2_normalize(result.embedding))
+                existing_idea.normalized = True
                 existing_idea.text_hash = result.text_hash
                 existing_idea.model_name = result.model_name
                 existing_idea.dimensions = result.dimensions
@@ -1111,7 +1716,8 @@ def generate_embeddings(project_id: int, db: Session = Depends(get_db)):
             else:
                 new_embedding = IdeaEmbedding(
                     project_id=project_id,
-                    embedding=embedding_service.embedding_to_json(result.embedding),
+                    embedding=_embedding_to_bytes(_l2_normalize(result.embedding)),
+                    normalized=True,
                     text_hash=result.text_hash,
                     model_name=result.model_name,
                     dimensions=result.dimensions
@@ -1129,42 +1735,171 @@ def generate_embeddings(project_id: int, db: Session = Depends(get_db)):
                 error=result.error
             )
     
+    # Merge a previously submitted provider batch once it completes: its
+    # vectors land in the in-process memo, so the normal pass below picks
+    # them up without any further provider calls.
+    state = db_project.analysis_state
+    if state is not None and state.embedding_batch_id:
+        fetch_fn = getattr(embedding_service, "fetch_embedding_batch", None)
+        if fetch_fn is not None:
+            batch_results = await asyncio.to_thread(fetch_fn, state.embedding_batch_id)
+            if batch_results is not None:  # None while the batch is still running
+                for text_hash, result in batch_results.items():
+                    _embedding_cache_put(text_hash, result)
+                state.embedding_batch_id = None
+
     # Generate evidence embeddings
     evidence = db.query(CandidateEvidence).filter(
         CandidateEvidence.project_id == project_id
     ).all()
-    
+
+    # Preload cached embeddings in one query instead of one per evidence row
+    existing_evs = {
+        e.evidence_id: e for e in db.query(EvidenceEmbedding).filter(
+            EvidenceEmbedding.evidence_id.in_([ev.id for ev in evidence])
+        ).all()
+    } if evidence else {}
+
+    # First pass: decide what is stale without any network calls
     evidence_embedded = 0
+    pending = []  # (evidence, text, text hash)
     for ev in evidence:
         ev_text = f"{ev.title}. {ev.abstract or ''}"
         ev_hash = embedding_service.compute_text_hash(ev_text)
-        
-        existing_ev = db.query(EvidenceEmbedding).filter(
-            EvidenceEmbedding.evidence_id == ev.id
-        ).first()
-        
+        existing_ev = existing_evs.get(ev.id)
+
         if existing_ev and existing_ev.text_hash == ev_hash:
             evidence_embedded += 1
             continue
-        
-        result = embedding_service.generate_embedding(ev_text)
-        if result.success:
-            if existing_ev:
-                existing_ev.embedding = embedding_service.embedding_to_json(result.embedding)
-                existing_ev.text_hash = result.text_hash
-                existing_ev.model_name = result.model_name
-                existing_ev.dimensions = result.dimensions
-                existing_ev.created_at = datetime.utcnow()
+
+        pending.append((ev, ev_text, ev_hash))
+
+    # Second pass: embed all stale texts in as few provider calls as
+    # possible. The OpenAI-compatible embeddings endpoint accepts an array
+    # input, so ceil(N/96) round trips replace N when the service exposes a
+    # batch entry point; otherwise this degrades to the per-text loop.
+    if pending:
+        # Serve memoized results first and dedupe the rest by hash, so
+        # repeated texts cost at most one provider call.
+        results_by_hash = {}
+        misses = []
+        for item in pending:
+            ev_hash = item[2]
+            if ev_hash in results_by_hash:
+                continue
+            hit = _embedding_cache_get(ev_hash)
+            if hit is not None:
+                results_by_hash[ev_hash] = hit
             else:
-                new_ev_emb = EvidenceEmbedding(
-                    evidence_id=ev.id,
-                    embedding=embedding_service.embedding_to_json(result.embedding),
-                    text_hash=result.text_hash,
-                    model_name=result.model_name,
-                    dimensions=result.dimensions
+                results_by_hash[ev_hash] = None  # placeholder marks it queued
+                misses.append(item)
+
+        if misses:
+            # Persistent cross-project cache: text already embedded for any
+            # project (duplicate patents are common) costs zero provider calls.
+            for row in db.query(EmbeddingCache).filter(
+                EmbeddingCache.text_hash.in_([h for _, _, h in misses])
+            ).all():
+                hit = _CachedEmbeddingResult(
+                    embedding=_embedding_from_bytes(row.embedding),
+                    text_hash=row.text_hash,
+                    model_name=row.model_name,
+                    dimensions=row.dimensions
                 )
-                db.add(new_ev_emb)
-            evidence_embedded += 1
+                results_by_hash[row.text_hash] = hit
+                _embedding_cache_put(row.text_hash, hit)
+            misses = [item for item in misses if results_by_hash.get(item[2]) is None]
+
+        if misses and mode == "batch":
+            # Offline path: hand the stale texts to the provider's Batch API
+            # and record the handle; a later call merges the results.
+            submit_fn = getattr(embedding_service, "submit_embedding_batch", None)
+            if submit_fn is None:
+                return EmbeddingGenerationResponse(
+                    success=False,
+                    project_id=project_id,
+                    idea_embedded=idea_embedded,
+                    evidence_embedded=evidence_embedded,
+                    total_evidence=len(evidence),
+                    notes="",
+                    error="Batch mode is not supported by the embedding service."
+                )
+            batch_id = await asyncio.to_thread(
+                submit_fn, [(ev_hash, text) for _, text, ev_hash in misses]
+            )
+            if state is not None:
+                state.embedding_batch_id = batch_id
+            db.commit()
+            return EmbeddingGenerationResponse(
+                success=True,
+                project_id=project_id,
+                idea_embedded=idea_embedded,
+                evidence_embedded=evidence_embedded,
+                total_evidence=len(evidence),
+                notes=f"Submitted {len(misses)} texts as provider batch {batch_id}. "
+                      "Call this endpoint again after the batch completes to merge results."
+            )
+
+        if misses:
+            batch_fn = getattr(embedding_service, "generate_embeddings_batch", None)
+            if batch_fn is not None:
+                miss_results = await asyncio.to_thread(
+                    batch_fn, [text for _, text, _ in misses], batch_size=96
+                )
+            else:
+                miss_results = await asyncio.to_thread(
+                    lambda: [_embed_text_cached(text, h) for _, text, h in misses]
+                )
+            new_cache_rows = []
+            for (_, _, ev_hash), result in zip(misses, miss_results):
+                results_by_hash[ev_hash] = result
+                _embedding_cache_put(ev_hash, result)
+                if result.success:
+                    new_cache_rows.append({
+                        "text_hash": ev_hash,
+                        "embedding": _embedding_to_bytes(_l2_normalize(result.embedding)),
+                        "model_name": result.model_name,
+                        "dimensions": result.dimensions,
+                    })
+            if new_cache_rows:
+                # do_nothing keeps concurrent workers race-safe on the PK
+                db.execute(
+                    sqlite_insert(EmbeddingCache).values(new_cache_rows)
+                    .on_conflict_do_nothing(index_elements=["text_hash"])
+                )
+
+        # Store every fresh vector in one bulk upsert keyed on the unique
+        # evidence_id - no per-row ORM objects or unit-of-work bookkeeping.
+        now = datetime.utcnow()
+        emb_rows = []
+        for ev, _, ev_hash in pending:
+            result = results_by_hash.get(ev_hash)
+            if result is None or not result.success:
+                continue
+            emb_rows.append({
+                "evidence_id": ev.id,
+                "embedding": _embedding_to_bytes(_l2_normalize(result.embedding)),
+                "normalized": True,
+                "text_hash": result.text_hash,
+                "model_name": result.model_name,
+                "dimensions": result.dimensions,
+                "created_at": now,
+            })
+        if emb_rows:
+            stmt = sqlite_insert(EvidenceEmbedding).values(emb_rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["evidence_id"],
+                set_={
+                    "embedding": stmt.excluded.embedding,
+                    "normalized": stmt.excluded.normalized,
+                    "text_hash": stmt.excluded.text_hash,
+                    "model_name": stmt.excluded.model_name,
+                    "dimensions": stmt.excluded.dimensions,
+                    "created_at": stmt.excluded.created_at,
+                }
+            )
+            db.execute(stmt)
+        evidence_embedded += len(emb_rows)
     
     db.commit()
     
@@ -1179,7 +1914,7 @@ def generate_embeddings(project_id: int, db: Session = Depends(get_db)):
 
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/compute-similarity",
+    f"{API_PREFIX}/projects/{{project_id}}/compute-similarity",
     response_model=SimilarityComputationResponse,
     tags=["Similarity & Novelty"]
 )
@@ -1192,7 +1927,7 @@ def compute_similarity(project_id: int, db: Session = Depends(get_db)):
     
     ⚠️ Requires embeddings to be generated first.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1214,58 +1949,83 @@ def compute_similarity(project_id: int, db: Session = Depends(get_db)):
             error="Idea embedding not found. Generate embeddings first."
         )
     
-    idea_vector = embedding_service.embedding_from_json(idea_emb.embedding)
-    
-    # Get all evidence with embeddings
-    evidence = db.query(CandidateEvidence).filter(
+    idea_vector = _embedding_from_bytes(idea_emb.embedding)
+
+    # Fetch evidence and embeddings in ONE joined query (evidence without an
+    # embedding is skipped by the inner join), and preload existing scores in
+    # one more - previously this ran two queries per evidence row.
+    embedded_evidence = db.query(
+        CandidateEvidence.id,
+        CandidateEvidence.source_type,
+        EvidenceEmbedding.embedding,
+        EvidenceEmbedding.normalized
+    ).join(
+        EvidenceEmbedding, EvidenceEmbedding.evidence_id == CandidateEvidence.id
+    ).filter(
         CandidateEvidence.project_id == project_id
     ).all()
+
+    vectors = [
+        _embedding_from_bytes(embedding_json)
+        for _, _, embedding_json, _ in embedded_evidence
+    ]
+    # Dot-product fast path once every row was normalized at write time;
+    # any legacy row drops the whole batch back to full cosine.
+    all_unit = bool(idea_emb.normalized) and all(
+        normalized for _, _, _, normalized in embedded_evidence
+    )
+    scores = _cosine_scores(idea_vector, vectors, assume_unit=all_unit)
+
+    max_score = max(scores, default=0.0)
+    now = datetime.utcnow()
+
+    # Single bulk upsert against the (project_id, evidence_id) unique index -
+    # previously every evidence row cost a SELECT plus an UPDATE or INSERT.
+    score_rows = [
+        {
+            "project_id": project_id,
+            "evidence_id": evidence_id,
+            "score": int(score * 10000),  # Store as int for precision
+            "evidence_type": source_type,
+            "computed_at": now,
+        }
+        for (evidence_id, source_type, _, _), score in zip(embedded_evidence, scores)
+    ]
+    if score_rows:
+        stmt = sqlite_insert(SimilarityScore).values(score_rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["project_id", "evidence_id"],
+            set_={
+                "score": stmt.excluded.score,
+                "evidence_type": stmt.excluded.evidence_type,
+                "computed_at": stmt.excluded.computed_at,
+            }
+        )
+        db.execute(stmt)
+
+    scores_computed = len(score_rows)
     
-    scores_computed = 0
-    max_score = 0.0
-    
-    for ev in evidence:
-        ev_emb = db.query(EvidenceEmbedding).filter(
-            EvidenceEmbedding.evidence_id == ev.id
-        ).first()
-        
-        if not ev_emb:
-            continue
-        
-        ev_vector = embedding_service.embedding_from_json(ev_emb.embedding)
-        
-        # Compute cosine similarity
-        score = similarity_engine.cosine_similarity(idea_vector, ev_vector)
-        score_int = int(score * 10000)  # Store as int for precision
-        
-        # Update or create similarity score
-        existing_score = db.query(SimilarityScore).filter(
-            SimilarityScore.project_id == project_id,
-            SimilarityScore.evidence_id == ev.id
-        ).first()
-        
-        if existing_score:
-            existing_score.score = score_int
-            existing_score.computed_at = datetime.utcnow()
-        else:
-            new_score = SimilarityScore(
-                project_id=project_id,
-                evidence_id=ev.id,
-                score=score_int,
-                evidence_type=ev.source_type
-            )
-            db.add(new_score)
-        
-        scores_computed += 1
-        max_score = max(max_score, score)
-    
-    # Update analysis state
+    # Update analysis state, maintaining the per-type aggregates here at
+    # the single write site - novelty-risk reads then skip their rollup.
     if db_project.analysis_state:
-        db_project.analysis_state.similarity_computed = True
-        db_project.analysis_state.max_similarity_score = int(max_score * 10000)
-    
+        state = db_project.analysis_state
+        state.similarity_computed = True
+        state.max_similarity_score = int(max_score * 10000)
+        by_type = {}
+        for row in score_rows:
+            prev_max, count = by_type.get(row["evidence_type"], (0, 0))
+            by_type[row["evidence_type"]] = (max(prev_max, row["score"]), count + 1)
+        research = by_type.get("paper")
+        patent = by_type.get("patent")
+        state.research_max_score = research[0] if research else None
+        state.research_match_count = research[1] if research else 0
+        state.patent_max_score = patent[0] if patent else None
+        state.patent_match_count = patent[1] if patent else 0
+        if score_rows:
+            state.top_evidence_id = max(score_rows, key=lambda r: r["score"])["evidence_id"]
+
     db.commit()
-    
+
     return SimilarityComputationResponse(
         success=True,
         project_id=project_id,
@@ -1276,7 +2036,7 @@ def compute_similarity(project_id: int, db: Session = Depends(get_db)):
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/novelty-risk",
+    f"{API_PREFIX}/projects/{{project_id}}/novelty-risk",
     response_model=NoveltyRiskResponse,
     tags=["Similarity & Novelty"]
 )
@@ -1292,19 +2052,36 @@ def get_novelty_risk(project_id: int, db: Session = Depends(get_db)):
     
     ⚠️ Every risk is traceable to specific evidence.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
     
-    # Get all similarity scores
-    scores = db.query(SimilarityScore).filter(
-        SimilarityScore.project_id == project_id
-    ).all()
-    
-    if not scores:
+    # Prefer the aggregates compute_similarity precomputed on the state
+    # row (a PK lookup already in hand); states written before that
+    # existed fall back to the GROUP BY rollup.
+    state = db_project.analysis_state
+    if state is not None and state.research_match_count is not None:
+        type_stats = {}
+        if state.research_match_count:
+            type_stats["paper"] = (state.research_max_score / 10000.0, state.research_match_count)
+        if state.patent_match_count:
+            type_stats["patent"] = (state.patent_max_score / 10000.0, state.patent_match_count)
+    else:
+        type_stats = {
+            evidence_type: (max_score / 10000.0, matches)
+            for evidence_type, max_score, matches in db.query(
+                SimilarityScore.evidence_type,
+                func.max(SimilarityScore.score),
+                func.count(SimilarityScore.id)
+            ).filter(
+                SimilarityScore.project_id == project_id
+            ).group_by(SimilarityScore.evidence_type).all()
+        }
+
+    if not type_stats:
         # Update analysis state
         if db_project.analysis_state:
             db_project.analysis_state.novelty_risk = NoveltyRiskLevelModel.UNKNOWN
@@ -1325,14 +2102,9 @@ def get_novelty_risk(project_id: int, db: Session = Depends(get_db)):
             notes="Insufficient evidence to assess novelty risk."
         )
     
-    # Separate by type
-    research_scores = [s for s in scores if s.evidence_type == "paper"]
-    patent_scores = [s for s in scores if s.evidence_type == "patent"]
-    
-    # Compute risk for each type
-    research_max = max([s.score_float for s in research_scores]) if research_scores else None
-    patent_max = max([s.score_float for s in patent_scores]) if patent_scores else None
-    
+    research_max, research_matches = type_stats.get("paper", (None, 0))
+    patent_max, patent_matches = type_stats.get("patent", (None, 0))
+
     research_risk = (
         similarity_engine.classify_novelty_risk(research_max, "paper")
         if research_max is not None
@@ -1344,16 +2116,19 @@ def get_novelty_risk(project_id: int, db: Session = Depends(get_db)):
         else similarity_engine.NoveltyRisk.UNKNOWN
     )
     
-    # Overall risk (max of both)
-    all_scores_float = [s.score_float for s in scores]
-    max_score = max(all_scores_float)
-    
-    # Find top match
-    top_score = max(scores, key=lambda s: s.score)
-    top_evidence = db.query(CandidateEvidence).filter(
-        CandidateEvidence.id == top_score.evidence_id
-    ).first()
-    
+    # Overall risk (max of both types)
+    max_score = max(
+        score for score, _ in type_stats.values() if score is not None
+    )
+
+    # Top match in one joined ORDER BY ... LIMIT 1 query instead of a Python
+    # scan plus a second fetch for the evidence row.
+    top_score, top_evidence = db.query(SimilarityScore, CandidateEvidence).join(
+        CandidateEvidence, CandidateEvidence.id == SimilarityScore.evidence_id
+    ).filter(
+        SimilarityScore.project_id == project_id
+    ).order_by(SimilarityScore.score.desc()).first()
+
     overall_risk = similarity_engine.classify_novelty_risk(max_score, top_score.evidence_type)
     
     # Build top match response
@@ -1392,17 +2167,17 @@ def get_novelty_risk(project_id: int, db: Session = Depends(get_db)):
         top_match=top_match,
         research_risk=NoveltyRiskLevel(research_risk.value),
         research_max_score=research_max,
-        research_matches=len(research_scores),
+        research_matches=research_matches,
         patent_risk=NoveltyRiskLevel(patent_risk.value),
         patent_max_score=patent_max,
-        patent_matches=len(patent_scores),
-        total_evidence_compared=len(scores),
+        patent_matches=patent_matches,
+        total_evidence_compared=sum(m for _, m in type_stats.values()),
         notes=notes
     )
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/similarity-scores",
+    f"{API_PREFIX}/projects/{{project_id}}/similarity-scores",
     response_model=SimilarityListResponse,
     tags=["Similarity & Novelty"]
 )
@@ -1416,33 +2191,33 @@ def list_similarity_scores(
     
     Each score is linked to specific evidence with verifiable URL.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
     
-    scores = db.query(SimilarityScore).filter(
+    # One joined query - the per-score evidence lookup was a round trip for
+    # every row returned.
+    rows = db.query(SimilarityScore, CandidateEvidence).join(
+        CandidateEvidence, CandidateEvidence.id == SimilarityScore.evidence_id
+    ).filter(
         SimilarityScore.project_id == project_id
     ).order_by(SimilarityScore.score.desc()).limit(limit).all()
-    
-    matches = []
-    for s in scores:
-        evidence = db.query(CandidateEvidence).filter(
-            CandidateEvidence.id == s.evidence_id
-        ).first()
-        
-        if evidence:
-            matches.append(SimilarityMatch(
-                evidence_id=evidence.id,
-                title=evidence.title,
-                authors=evidence.authors,
-                source=evidence.source_name.value,
-                source_url=evidence.source_url,
-                evidence_type=evidence.source_type,
-                similarity_score=s.score_float
-            ))
+
+    matches = [
+        SimilarityMatch(
+            evidence_id=evidence.id,
+            title=evidence.title,
+            authors=evidence.authors,
+            source=evidence.source_name.value,
+            source_url=evidence.source_url,
+            evidence_type=evidence.source_type,
+            similarity_score=s.score_float
+        )
+        for s, evidence in rows
+    ]
     
     return SimilarityListResponse(
         project_id=project_id,
@@ -1454,11 +2229,11 @@ def list_similarity_scores(
 # ============== Phase 5: Comparative Analysis Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/generate-comparison",
+    f"{API_PREFIX}/projects/{{project_id}}/generate-comparison",
     response_model=ComparativeAnalysisResponse,
     tags=["Comparative Analysis"]
 )
-def generate_comparison(
+async def generate_comparison(
     project_id: int,
     top_k: int = 5,
     db: Session = Depends(get_db)
@@ -1474,7 +2249,7 @@ def generate_comparison(
     - LLM cannot override similarity scores
     - Limitations are always stated
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1540,8 +2315,27 @@ def generate_comparison(
         if db_project.analysis_state.max_similarity_score:
             max_similarity = db_project.analysis_state.max_similarity_score / 10000.0
     
+    # Short-circuit when nothing feeding the prompt has changed since the
+    # latest version - the LLM would produce an equivalent analysis, so
+    # return the stored one (no tokens, no new version row).
+    input_hash = hashlib.sha256("|".join([
+        idea_text,
+        ",".join(str(i) for i in sorted(e["id"] for e in evidence_items)),
+        f"{max_similarity:.4f}",
+        overall_risk,
+    ]).encode()).hexdigest()
+
+    last_analysis = db.query(ComparativeAnalysis).filter(
+        ComparativeAnalysis.project_id == project_id
+    ).order_by(ComparativeAnalysis.version.desc()).first()
+
+    if last_analysis is not None and last_analysis.input_hash == input_hash:
+        return get_comparison(project_id, db)
+
     # Generate multi-evidence comparison
-    analysis_result = comparative_service.generate_multi_evidence_comparison(
+    analysis_result = await _await_service_call(
+        comparative_service,
+        "generate_multi_evidence_comparison",
         idea_text=idea_text,
         evidence_items=evidence_items,
         overall_risk=overall_risk,
@@ -1566,25 +2360,23 @@ def generate_comparison(
     if "limitations" in analysis_result:
         limitations.extend(analysis_result.get("limitations", []))
     
-    # Get next version number
-    last_analysis = db.query(ComparativeAnalysis).filter(
-        ComparativeAnalysis.project_id == project_id
-    ).order_by(ComparativeAnalysis.version.desc()).first()
+    # Next version number (latest row already fetched for the hash check)
     next_version = (last_analysis.version + 1) if last_analysis else 1
     
     # Store in database
     new_analysis = ComparativeAnalysis(
         project_id=project_id,
         version=next_version,
-        evidence_ids=json.dumps([e["id"] for e in evidence_items]),
+        evidence_ids=_json_dumps([e["id"] for e in evidence_items]),
         existing_work_summary=analysis_result.get("existing_landscape", ""),
-        overlap_analysis=json.dumps(analysis_result.get("key_overlaps", [])),
-        differentiation_analysis=json.dumps(analysis_result.get("potential_differentiators", [])),
+        overlap_analysis=_json_dumps(analysis_result.get("key_overlaps", [])),
+        differentiation_analysis=_json_dumps(analysis_result.get("potential_differentiators", [])),
         novelty_explanation=analysis_result.get("risk_explanation", ""),
-        limitations=json.dumps(limitations),
+        limitations=_json_dumps(limitations),
         confidence_level=analysis_result.get("confidence_level", "medium"),
         input_novelty_risk=overall_risk,
-        input_max_similarity=int(max_similarity * 10000)
+        input_max_similarity=int(max_similarity * 10000),
+        input_hash=input_hash
     )
     db.add(new_analysis)
     
@@ -1646,58 +2438,94 @@ def generate_comparison(
     )
 
 
+# A comparative analysis is immutable once written (generate_comparison
+# always inserts a new version), so its parsed response can be cached
+# indefinitely keyed by (project_id, version) - version bumps invalidate
+# naturally. Bounded dict+lock, same shape as the embedding memo.
+_COMPARISON_CACHE_MAX = 256
+_comparison_cache = {}  # (project_id, version) -> ComparativeAnalysisResponse
+_comparison_cache_lock = threading.Lock()
+
+
+def _comparison_cache_get(key):
+    with _comparison_cache_lock:
+        return _comparison_cache.get(key)
+
+
+def _comparison_cache_put(key, response):
+    with _comparison_cache_lock:
+        if len(_comparison_cache) >= _COMPARISON_CACHE_MAX:
+            _comparison_cache.pop(next(iter(_comparison_cache)))
+        _comparison_cache[key] = response
+
+
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/comparison",
+    f"{API_PREFIX}/projects/{{project_id}}/comparison",
     response_model=ComparativeAnalysisResponse,
     tags=["Comparative Analysis"]
 )
 def get_comparison(project_id: int, db: Session = Depends(get_db)):
     """
     Get latest comparative analysis for a project.
-    
+
     Returns the most recent version of evidence-grounded analysis.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
-    
+
     # Get latest analysis
     analysis = db.query(ComparativeAnalysis).filter(
         ComparativeAnalysis.project_id == project_id
     ).order_by(ComparativeAnalysis.version.desc()).first()
-    
+
     if not analysis:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No comparative analysis found. Generate one first."
         )
-    
+
+    # Hot dashboard reads skip the four JSON parses and evidence lookups
+    cached = _comparison_cache_get((project_id, analysis.version))
+    if cached is not None:
+        return cached
+
     # Parse stored JSON fields
-    evidence_ids = json.loads(analysis.evidence_ids) if analysis.evidence_ids else []
-    overlap_raw = json.loads(analysis.overlap_analysis) if analysis.overlap_analysis else []
-    diff_raw = json.loads(analysis.differentiation_analysis) if analysis.differentiation_analysis else []
-    limitations = json.loads(analysis.limitations) if analysis.limitations else []
-    
-    # Build evidence summaries
+    evidence_ids = _json_loads(analysis.evidence_ids) if analysis.evidence_ids else []
+    overlap_raw = analysis.overlap_items
+    diff_raw = analysis.differentiation_items
+    limitations = _json_loads(analysis.limitations) if analysis.limitations else []
+    
+    # Build evidence summaries. One LEFT JOIN round trip fetches every
+    # evidence row with its score (evidence without a score keeps None).
+    evidence_map = {}
+    score_map = {}
+    if evidence_ids:
+        rows = db.query(CandidateEvidence, SimilarityScore.score).outerjoin(
+            SimilarityScore,
+            (SimilarityScore.evidence_id == CandidateEvidence.id)
+            & (SimilarityScore.project_id == project_id)
+        ).filter(CandidateEvidence.id.in_(evidence_ids)).all()
+        for ev, score in rows:
+            evidence_map[ev.id] = ev
+            score_map[ev.id] = score
+
     evidence_summaries = []
     research_count = 0
     patent_count = 0
     for ev_id in evidence_ids:
-        ev = db.query(CandidateEvidence).filter(CandidateEvidence.id == ev_id).first()
-        score = db.query(SimilarityScore).filter(
-            SimilarityScore.project_id == project_id,
-            SimilarityScore.evidence_id == ev_id
-        ).first()
+        ev = evidence_map.get(ev_id)
         if ev:
+            score = score_map.get(ev_id)
             evidence_summaries.append(EvidenceSummaryItem(
                 evidence_id=ev.id,
                 title=ev.title,
                 source=ev.source_name.value,
                 source_url=ev.source_url,
-                similarity_score=score.score_float if score else 0.0,
+                similarity_score=score / 10000.0 if score is not None else 0.0,
                 summary=f"Retrieved from {ev.source_name.value}"
             ))
             if ev.source_type == "paper":
@@ -1726,7 +2554,7 @@ def get_comparison(project_id: int, db: Session = Depends(get_db)):
                 uncertainty=diff.get("uncertainty", "Requires verification")
             ))
     
-    return ComparativeAnalysisResponse(
+    response = ComparativeAnalysisResponse(
         project_id=project_id,
         version=analysis.version,
         novelty_risk=NoveltyRiskLevel(analysis.input_novelty_risk),
@@ -1744,18 +2572,21 @@ def get_comparison(project_id: int, db: Session = Depends(get_db)):
         patent_count=patent_count,
         generated_at=analysis.created_at.isoformat()
     )
+    _comparison_cache_put((project_id, analysis.version), response)
+    return response
 
 
 # ============== Phase 6: Draft Optimization Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/draft-optimize",
+    f"{API_PREFIX}/projects/{{project_id}}/draft-optimize",
     response_model=DraftOptimizeResponse,
     tags=["Draft Optimization"]
 )
-def optimize_draft(
+async def optimize_draft(
     project_id: int,
     request: DraftOptimizeRequest,
+    background: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -1767,7 +2598,7 @@ def optimize_draft(
     - NO claims of novelty improvement
     - Suggestions are LOCALIZED and REJECTABLE
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1787,14 +2618,14 @@ def optimize_draft(
     if latest_analysis:
         analysis_data = {
             "existing_landscape": latest_analysis.existing_work_summary,
-            "key_overlaps": json.loads(latest_analysis.overlap_analysis) if latest_analysis.overlap_analysis else [],
-            "potential_differentiators": json.loads(latest_analysis.differentiation_analysis) if latest_analysis.differentiation_analysis else []
+            "key_overlaps": latest_analysis.overlap_items,
+            "potential_differentiators": latest_analysis.differentiation_items
         }
         overlap_context = draft_service.build_overlap_context_from_analysis(analysis_data)
         novelty_risk = latest_analysis.input_novelty_risk
     
     # Generate suggestions using LLM
-    result = draft_service.generate_draft_suggestions(
+    result = await draft_service.generate_draft_suggestions_async(
         draft_text=draft_text,
         overlap_context=overlap_context,
         novelty_risk=novelty_risk
@@ -1821,54 +2652,67 @@ def optimize_draft(
     db.add(new_draft)
     db.flush()  # Get the ID
     
-    # Store suggestions
+    # Store suggestions in one bulk INSERT ... RETURNING - the old loop
+    # paid a flush round-trip per row just to learn each new id.
     suggestion_items = []
-    for s in result["suggestions"]:
-        new_suggestion = DraftSuggestion(
-            draft_version_id=new_draft.id,
-            original_snippet=s["original_text_snippet"],
-            suggested_revision=s["suggested_revision"],
-            reason=s["reason_for_change"],
-            change_type=ChangeTypeModel(s["change_type"]),
-            preserves_intent=PreservesIntentModel(s["preserves_intent"]),
-            status=SuggestionStatusModel.PENDING,
-            start_position=s.get("start_position"),
-            end_position=s.get("end_position")
-        )
-        db.add(new_suggestion)
-        db.flush()
-        
-        suggestion_items.append(DraftSuggestionItem(
-            id=new_suggestion.id,
-            original_text_snippet=s["original_text_snippet"],
-            suggested_revision=s["suggested_revision"],
-            reason_for_change=s["reason_for_change"],
-            change_type=ChangeType(s["change_type"]),
-            preserves_intent=PreservesIntent(s["preserves_intent"]),
-            status=SuggestionStatus.PENDING,
-            start_position=s.get("start_position"),
-            end_position=s.get("end_position")
-        ))
+    suggestions = result["suggestions"]
+    if suggestions:
+        new_ids = db.execute(
+            insert(DraftSuggestion).returning(
+                DraftSuggestion.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "draft_version_id": new_draft.id,
+                    "original_snippet": s["original_text_snippet"],
+                    "suggested_revision": s["suggested_revision"],
+                    "reason": s["reason_for_change"],
+                    "change_type": ChangeTypeModel(s["change_type"]),
+                    "preserves_intent": PreservesIntentModel(s["preserves_intent"]),
+                    "status": SuggestionStatusModel.PENDING,
+                    "start_position": s.get("start_position"),
+                    "end_position": s.get("end_position"),
+                }
+                for s in suggestions
+            ],
+        ).scalars().all()
+
+        for s, suggestion_id in zip(suggestions, new_ids):
+            suggestion_items.append(DraftSuggestionItem(
+                id=suggestion_id,
+                original_text_snippet=s["original_text_snippet"],
+                suggested_revision=s["suggested_revision"],
+                reason_for_change=s["reason_for_change"],
+                change_type=ChangeType(s["change_type"]),
+                preserves_intent=PreservesIntent(s["preserves_intent"]),
+                status=SuggestionStatus.PENDING,
+                start_position=s.get("start_position"),
+                end_position=s.get("end_position")
+            ))
     
     # Update analysis state
     if db_project.analysis_state:
         db_project.analysis_state.notes = f"Draft optimization v{next_version} generated with {len(suggestion_items)} suggestions."
     
-    db.commit()
-    
-    # Phase 10: Audit Log
-    audit_service.log_action(
-        db, 
-        "DRAFT_OPTIMIZED", 
-        "DraftVersion", 
-        new_draft.id, 
+    # Phase 10: Audit Log (deferred; in compliance mode the entry joins the
+    # commit below so the endpoint issues a single fsync)
+    audit_service.log_action_deferred(
+        background,
+        db,
+        "DRAFT_OPTIMIZED",
+        "DraftVersion",
+        new_draft.id,
         None,
         metadata={
              "suggestions_count": len(suggestion_items),
              "model": settings.llm_model,
              "project_id": project_id
-        }
+        },
+        project_id=project_id,
+        commit=False
     )
+
+    db.commit()
     
     return DraftOptimizeResponse(
         success=True,
@@ -1883,7 +2727,7 @@ def optimize_draft(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/draft-versions",
+    f"{API_PREFIX}/projects/{{project_id}}/draft-versions",
     response_model=DraftHistoryResponse,
     tags=["Draft Optimization"]
 )
@@ -1891,36 +2735,58 @@ def get_draft_history(project_id: int, db: Session = Depends(get_db)):
     """
     Get all draft versions for a project.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
     
-    drafts = db.query(DraftVersion).filter(
+    # Truncate the preview in SQL: original_text can run to tens of
+    # kilobytes per version and the history view only ever shows the first
+    # 500 characters, so ship the substring plus the length instead of the
+    # whole TEXT blob.
+    drafts = db.query(
+        DraftVersion.id,
+        DraftVersion.project_id,
+        DraftVersion.version,
+        func.substr(DraftVersion.original_text, 1, 500).label("preview"),
+        func.length(DraftVersion.original_text).label("text_length"),
+        DraftVersion.created_at
+    ).filter(
         DraftVersion.project_id == project_id
     ).order_by(DraftVersion.version.desc()).all()
     
+    # One grouped count query covers every draft; the old per-draft fetch
+    # pulled full suggestion rows back just to tally statuses in Python.
+    status_counts = {}
+    if drafts:
+        grouped = db.query(
+            DraftSuggestion.draft_version_id,
+            DraftSuggestion.status,
+            func.count(DraftSuggestion.id)
+        ).filter(
+            DraftSuggestion.draft_version_id.in_([d.id for d in drafts])
+        ).group_by(
+            DraftSuggestion.draft_version_id,
+            DraftSuggestion.status
+        ).all()
+        for draft_id, suggestion_status, count in grouped:
+            status_counts.setdefault(draft_id, {})[suggestion_status] = count
+
     versions = []
     for draft in drafts:
-        suggestions = db.query(DraftSuggestion).filter(
-            DraftSuggestion.draft_version_id == draft.id
-        ).all()
-        
-        pending = sum(1 for s in suggestions if s.status == SuggestionStatusModel.PENDING)
-        accepted = sum(1 for s in suggestions if s.status == SuggestionStatusModel.ACCEPTED)
-        rejected = sum(1 for s in suggestions if s.status == SuggestionStatusModel.REJECTED)
-        
+        counts = status_counts.get(draft.id, {})
+
         versions.append(DraftVersionResponse(
             id=draft.id,
             project_id=draft.project_id,
             version=draft.version,
-            original_text=draft.original_text[:500] + "..." if len(draft.original_text) > 500 else draft.original_text,
-            suggestions_count=len(suggestions),
-            pending_count=pending,
-            accepted_count=accepted,
-            rejected_count=rejected,
+            original_text=draft.preview + "..." if draft.text_length > 500 else draft.preview,
+            suggestions_count=sum(counts.values()),
+            pending_count=counts.get(SuggestionStatusModel.PENDING, 0),
+            accepted_count=counts.get(SuggestionStatusModel.ACCEPTED, 0),
+            rejected_count=counts.get(SuggestionStatusModel.REJECTED, 0),
             created_at=draft.created_at
         ))
     
@@ -1932,7 +2798,7 @@ def get_draft_history(project_id: int, db: Session = Depends(get_db)):
 
 
 @app.put(
-    f"{settings.api_prefix}/suggestions/{{suggestion_id}}",
+    f"{API_PREFIX}/suggestions/{{suggestion_id}}",
     response_model=SuggestionUpdateResponse,
     tags=["Draft Optimization"]
 )
@@ -1975,7 +2841,7 @@ def update_suggestion_status(
 # ============== Phase 7: Venue Recommendation Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/recommendations/venues",
+    f"{API_PREFIX}/recommendations/venues",
     response_model=VenueRecommendationResponse,
     tags=["Venue Recommendations"]
 )
@@ -1992,7 +2858,7 @@ def get_venue_recommendations(
     - Based on topic matching and novelty risk
     - Always includes limitations
     """
-    db_project = crud.get_project(db, request.project_id)
+    db_project = db.get(Project, request.project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2087,12 +2953,13 @@ def get_venue_recommendations(
 # ============== Phase 8: Patent Claim Structuring Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/projects/{{project_id}}/claims/generate",
+    f"{API_PREFIX}/projects/{{project_id}}/claims/generate",
     response_model=ClaimGenerationResponse,
     tags=["Patent Claims"]
 )
-def generate_claims(
+async def generate_claims(
     project_id: int,
+    background: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -2105,7 +2972,7 @@ def generate_claims(
     
     NEVER asserts patentability or legal validity.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2140,14 +3007,14 @@ def generate_claims(
     if latest_analysis:
         analysis_data = {
             "existing_work_summary": latest_analysis.existing_work_summary,
-            "overlaps": json.loads(latest_analysis.overlap_analysis) if latest_analysis.overlap_analysis else [],
-            "differentiators": json.loads(latest_analysis.differentiation_analysis) if latest_analysis.differentiation_analysis else []
+            "overlaps": latest_analysis.overlap_items,
+            "differentiators": latest_analysis.differentiation_items
         }
         overlap_context = claim_service.build_overlap_context(analysis_data)
         novelty_risk = latest_analysis.input_novelty_risk
     
-    # Generate claims
-    result = claim_service.generate_claim_structure(
+    # Generate claims (LLM call runs off the event loop)
+    result = await claim_service.generate_claim_structure_async(
         idea_text=db_project.idea_text,
         overlap_context=overlap_context,
         novelty_risk=novelty_risk
@@ -2165,6 +3032,9 @@ def generate_claims(
     ).order_by(ClaimDraft.version.desc()).first()
     next_version = (last_claim.version + 1) if last_claim else 1
     
+    # Tally claim types once instead of re-scanning the list per count
+    claim_type_counts = Counter(c.claim_type for c in result.claims)
+
     # Store generation metadata
     gen_metadata = ClaimGenerationMetadata(
         project_id=project_id,
@@ -2172,97 +3042,117 @@ def generate_claims(
         prompt_version=claim_service.PROMPT_VERSION,
         input_hash=result.input_hash,
         claims_generated=len(result.claims),
-        independent_claims=sum(1 for c in result.claims if c.claim_type == "INDEPENDENT"),
-        dependent_claims=sum(1 for c in result.claims if c.claim_type == "DEPENDENT")
+        independent_claims=claim_type_counts["INDEPENDENT"],
+        dependent_claims=claim_type_counts["DEPENDENT"]
     )
     db.add(gen_metadata)
     db.flush()
     
-    # Store claims
+    # Store claims in one bulk INSERT ... RETURNING instead of a flush
+    # round-trip per claim.
     claim_id_mapping = {}  # old claim_number -> new db id
     claim_items = []
+
+    if result.claims:
+        new_claim_ids = db.execute(
+            insert(ClaimDraft).returning(
+                ClaimDraft.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "project_id": project_id,
+                    "version": next_version,
+                    "claim_number": c.claim_number,
+                    "claim_type": ClaimTypeModel(c.claim_type),
+                    "claim_text": c.claim_text,
+                    "technical_feature": c.technical_feature,
+                    "explanation": c.explanation,
+                    "parent_claim_id": None,  # Set after first pass
+                }
+                for c in result.claims
+            ],
+        ).scalars().all()
+
+        for c, claim_id in zip(result.claims, new_claim_ids):
+            claim_id_mapping[c.claim_number] = claim_id
+            claim_items.append(ClaimDraftItem(
+                id=claim_id,
+                claim_number=c.claim_number,
+                claim_type=ClaimTypeSchema(c.claim_type),
+                claim_text=c.claim_text,
+                technical_feature=c.technical_feature,
+                explanation=c.explanation,
+                parent_claim_number=c.parent_claim_number
+            ))
     
-    for c in result.claims:
-        new_claim = ClaimDraft(
-            project_id=project_id,
-            version=next_version,
-            claim_number=c.claim_number,
-            claim_type=ClaimTypeModel(c.claim_type),
-            claim_text=c.claim_text,
-            technical_feature=c.technical_feature,
-            explanation=c.explanation,
-            parent_claim_id=None  # Set after first pass
-        )
-        db.add(new_claim)
-        db.flush()
-        claim_id_mapping[c.claim_number] = new_claim.id
-        
-        claim_items.append(ClaimDraftItem(
-            id=new_claim.id,
-            claim_number=c.claim_number,
-            claim_type=ClaimTypeSchema(c.claim_type),
-            claim_text=c.claim_text,
-            technical_feature=c.technical_feature,
-            explanation=c.explanation,
-            parent_claim_number=c.parent_claim_number
-        ))
-    
-    # Second pass: set parent claim ids
-    for c in result.claims:
-        if c.parent_claim_number and c.parent_claim_number in claim_id_mapping:
-            claim = db.query(ClaimDraft).filter(
-                ClaimDraft.id == claim_id_mapping[c.claim_number]
-            ).first()
-            if claim:
-                claim.parent_claim_id = claim_id_mapping[c.parent_claim_number]
+    # Second pass: set parent claim ids. Both ends of every link are already
+    # in claim_id_mapping, so one executemany UPDATE-by-primary-key wires
+    # them up without re-fetching any of the freshly inserted rows.
+    parent_links = [
+        {
+            "id": claim_id_mapping[c.claim_number],
+            "parent_claim_id": claim_id_mapping[c.parent_claim_number],
+        }
+        for c in result.claims
+        if c.parent_claim_number and c.parent_claim_number in claim_id_mapping
+    ]
+    if parent_links:
+        db.execute(update(ClaimDraft), parent_links)
     
-    # Store risk annotations
+    # Store risk annotations - same bulk RETURNING pattern as the claims
     risk_items = []
-    for r in result.risks:
-        if r.claim_number in claim_id_mapping:
-            new_risk = ClaimRiskAnnotation(
-                claim_id=claim_id_mapping[r.claim_number],
-                risk_type=ClaimRiskTypeModel(r.risk_type),
-                description=r.description,
-                evidence_id=r.evidence_id
-            )
-            db.add(new_risk)
-            db.flush()
-            
+    linked_risks = [r for r in result.risks if r.claim_number in claim_id_mapping]
+    if linked_risks:
+        new_risk_ids = db.execute(
+            insert(ClaimRiskAnnotation).returning(
+                ClaimRiskAnnotation.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "claim_id": claim_id_mapping[r.claim_number],
+                    "risk_type": ClaimRiskTypeModel(r.risk_type),
+                    "description": r.description,
+                    "evidence_id": r.evidence_id,
+                }
+                for r in linked_risks
+            ],
+        ).scalars().all()
+
+        for r, risk_id in zip(linked_risks, new_risk_ids):
             risk_items.append(ClaimRiskAnnotationItem(
-                id=new_risk.id,
+                id=risk_id,
                 claim_number=r.claim_number,
                 risk_type=ClaimRiskTypeSchema(r.risk_type),
                 description=r.description,
                 evidence_id=r.evidence_id
             ))
     
-    db.commit()
-    
-    # Phase 10: Audit Log
-    audit_service.log_action(
-        db, 
-        "CLAIMS_GENERATED", 
-        "Project", 
-        project_id, 
+    # Phase 10: Audit Log (deferred; in compliance mode the entry joins the
+    # commit below so the endpoint issues a single fsync)
+    audit_service.log_action_deferred(
+        background,
+        db,
+        "CLAIMS_GENERATED",
+        "Project",
+        project_id,
         None,
         metadata={
             "claims_count": len(result.claims),
             "novelty_risk": novelty_risk.value,
             "prompt_version": claim_service.PROMPT_VERSION
-        }
+        },
+        commit=False
     )
+
+    db.commit()
     
     # Build dependency graph
     graph = claim_service.build_dependency_graph(result.claims)
     
     # Build attorney handoff notes
-    independent_count = sum(1 for c in result.claims if c.claim_type == "INDEPENDENT")
-    dependent_count = sum(1 for c in result.claims if c.claim_type == "DEPENDENT")
-    
     handoff = AttorneyHandoffNotes(
-        independent_claims=independent_count,
-        dependent_claims=dependent_count,
+        independent_claims=claim_type_counts["INDEPENDENT"],
+        dependent_claims=claim_type_counts["DEPENDENT"],
         review_areas=result.review_areas,
         prior_art_notes=overlap_context[:500] if overlap_context else "Prior art analysis not performed.",
         novelty_risk=novelty_risk,
@@ -2288,7 +3178,7 @@ def generate_claims(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/claims",
+    f"{API_PREFIX}/projects/{{project_id}}/claims",
     response_model=ClaimsListResponse,
     tags=["Patent Claims"]
 )
@@ -2301,23 +3191,29 @@ def list_claims(
     
     Returns claims with risk annotations.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found"
         )
     
-    claims = db.query(ClaimDraft).filter(
+    # selectinload pulls every parent claim in one extra query instead of a
+    # lazy load per dependent claim inside the loop below.
+    claims = db.query(ClaimDraft).options(
+        selectinload(ClaimDraft.parent_claim)
+    ).filter(
         ClaimDraft.project_id == project_id
     ).order_by(ClaimDraft.version.desc(), ClaimDraft.claim_number).all()
-    
+
+    claims_by_id = {c.id: c for c in claims}
+
     claim_items = []
     for c in claims:
         parent_num = None
         if c.parent_claim:
             parent_num = c.parent_claim.claim_number
-            
+
         claim_items.append(ClaimDraftItem(
             id=c.id,
             claim_number=c.claim_number,
@@ -2332,14 +3228,13 @@ def list_claims(
         ))
     
     # Get risk annotations
-    claim_ids = [c.id for c in claims]
     risks = db.query(ClaimRiskAnnotation).filter(
-        ClaimRiskAnnotation.claim_id.in_(claim_ids)
-    ).all() if claim_ids else []
-    
+        ClaimRiskAnnotation.claim_id.in_(list(claims_by_id))
+    ).all() if claims_by_id else []
+
     risk_items = []
     for r in risks:
-        claim = next((c for c in claims if c.id == r.claim_id), None)
+        claim = claims_by_id.get(r.claim_id)
         risk_items.append(ClaimRiskAnnotationItem(
             id=r.id,
             claim_number=claim.claim_number if claim else 0,
@@ -2358,7 +3253,7 @@ def list_claims(
 
 
 @app.put(
-    f"{settings.api_prefix}/claims/{{claim_id}}",
+    f"{API_PREFIX}/claims/{{claim_id}}",
     response_model=ClaimUpdateResponse,
     tags=["Patent Claims"]
 )
@@ -2413,7 +3308,7 @@ def update_claim(
 
 
 @app.post(
-    f"{settings.api_prefix}/claims/{{claim_id}}/flag",
+    f"{API_PREFIX}/claims/{{claim_id}}/flag",
     response_model=ClaimFlagResponse,
     tags=["Patent Claims"]
 )
@@ -2448,7 +3343,7 @@ def flag_claim(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/claims/graph",
+    f"{API_PREFIX}/projects/{{project_id}}/claims/graph",
     tags=["Patent Claims"]
 )
 def get_claims_graph(
@@ -2460,7 +3355,7 @@ def get_claims_graph(
     
     Returns visualization-ready graph structure.
     """
-    db_project = crud.get_project(db, project_id)
+    db_project = db.get(Project, project_id)
     if not db_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2518,14 +3413,14 @@ def get_claims_graph(
 # ============== Phase 9: Feedback & Confidence Endpoints ==============
 
 @app.post(
-    f"{settings.api_prefix}/feedback",
+    f"{API_PREFIX}/feedback",
     response_model=FeedbackResponse,
     tags=["Feedback & Trust"]
 )
 def submit_feedback(
     request: FeedbackRequest,
     project_id: int, # Require project_id as query param for simplicity and robustness
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """
     Submit human feedback on any AI output.
@@ -2556,8 +3451,46 @@ def submit_feedback(
     )
 
 
+@app.post(
+    f"{API_PREFIX}/feedback/batch",
+    response_model=FeedbackBatchResponse,
+    tags=["Feedback & Trust"]
+)
+def submit_feedback_batch(
+    request: FeedbackBatchRequest,
+    project_id: int, # Require project_id as query param for simplicity and robustness
+    db: Session = Depends(get_write_db)
+):
+    """
+    Submit several feedback entries in ONE transaction.
+
+    One commit for the whole burst instead of one per entry.
+    Invalid entries are reported per-item without failing the batch.
+    """
+    results = feedback_service.submit_feedback_batch(db, [
+        feedback_service.FeedbackPayload(
+            output_id=item.output_id,
+            output_type=item.output_type,
+            project_id=project_id,
+            feedback_type=item.feedback_type,
+            comment=item.comment
+        )
+        for item in request.items
+    ])
+
+    return FeedbackBatchResponse(results=[
+        FeedbackResponse(
+            success=r.success,
+            feedback_id=r.feedback_id,
+            message=r.message,
+            timestamp=r.timestamp
+        )
+        for r in results
+    ])
+
+
 @app.get(
-    f"{settings.api_prefix}/feedback/{{output_id}}",
+    f"{API_PREFIX}/feedback/{{output_id}}",
     response_model=FeedbackSummaryResponse,
     tags=["Feedback & Trust"]
 )
@@ -2585,7 +3518,7 @@ def get_feedback_for_output(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/feedback",
+    f"{API_PREFIX}/projects/{{project_id}}/feedback",
     response_model=ProjectFeedbackStatsResponse,
     tags=["Feedback & Trust"]
 )
@@ -2622,7 +3555,7 @@ def get_project_feedback(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/confidence",
+    f"{API_PREFIX}/projects/{{project_id}}/confidence",
     response_model=ConfidenceCalibrationResponse,
     tags=["Feedback & Trust"]
 )
@@ -2651,25 +3584,28 @@ def get_project_confidence(
 
 
 @app.get(
-    f"{settings.api_prefix}/projects/{{project_id}}/audit",
+    f"{API_PREFIX}/projects/{{project_id}}/audit",
     response_model=AuditLogListResponse,
     tags=["Audit & Compliance"]
 )
 def get_project_audit_trail(
     project_id: int,
+    before_ts: datetime = None,
+    limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """
     Get audit trail for a project.
-    
+
     Returns immutable history of actions.
+    Pass the created_at of the last entry as before_ts to fetch the next page.
     """
-    logs = audit_service.get_project_audit_trail(db, project_id)
+    logs = audit_service.get_project_audit_trail(db, project_id, before_ts=before_ts, limit=limit)
     return AuditLogListResponse(logs=logs)
 
 
 @app.get(
-    f"{settings.api_prefix}/system/compliance",
+    f"{API_PREFIX}/system/compliance",
     response_model=ComplianceStatusResponse,
     tags=["Audit & Compliance"]
 )
@@ -2684,7 +3620,42 @@ def get_compliance_status():
 
 # ============== System Info ==============
 
-@app.get(f"{settings.api_prefix}/system/status", tags=["System"])
+# Status counts are informational, not live data: a half-minute-stale
+# number is fine on a dashboard that polls. One grouped query per TTL
+# window replaces three full COUNT scans per request.
+_STATUS_COUNTS_TTL_SECONDS = 30.0
+_status_counts_cache = None  # (expiry, counts dict)
+_status_counts_lock = threading.Lock()
+
+
+def _get_status_counts(db: Session) -> dict:
+    """Project/evidence counts for system_status, cached for a short TTL."""
+    global _status_counts_cache
+    now = time.monotonic()
+    with _status_counts_lock:
+        cached = _status_counts_cache
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+    project_count = db.query(func.count(Project.id)).scalar()
+    evidence_by_type = dict(
+        db.query(
+            CandidateEvidence.source_type,
+            func.count(CandidateEvidence.id)
+        ).group_by(CandidateEvidence.source_type).all()
+    )
+    counts = {
+        "projects": project_count,
+        "evidence_documents": sum(evidence_by_type.values()),
+        "research_papers": evidence_by_type.get("paper", 0),
+        "patents": evidence_by_type.get("patent", 0)
+    }
+    with _status_counts_lock:
+        _status_counts_cache = (now + _STATUS_COUNTS_TTL_SECONDS, counts)
+    return counts
+
+
+@app.get(f"{API_PREFIX}/system/status", tags=["System"])
 def system_status(db: Session = Depends(get_db)):
     """
     Get system status and current capabilities.
@@ -2693,25 +3664,16 @@ def system_status(db: Session = Depends(get_db)):
     """
     llm_configured = bool(settings.llm_api_key and settings.llm_api_key != "your-nebius-api-key-here")
     
-    # Get real counts from database
-    from models import Project, CandidateEvidence
-    project_count = db.query(Project).count()
-    evidence_count = db.query(CandidateEvidence).count()
-    paper_count = db.query(CandidateEvidence).filter(CandidateEvidence.source_type == "paper").count()
-    patent_count = db.query(CandidateEvidence).filter(CandidateEvidence.source_type == "patent").count()
-    
+    # Get real counts from database (grouped query behind a short TTL cache)
+    real_counts = _get_status_counts(db)
+
     return {
         "phase": 10,
         "version": "1.0.0",
         "ai_provider": settings.llm_provider if llm_configured else None,
         "ai_model": settings.llm_model if llm_configured else None,
         "embedding_model": settings.embedding_model,
-        "real_counts": {
-            "projects": project_count,
-            "evidence_documents": evidence_count,
-            "research_papers": paper_count,
-            "patents": patent_count
-        },
+        "real_counts": real_counts,
         "implemented": [
             "Project CRUD operations",
             "File upload and storage",
@@ -8,10 +8,25 @@ Models:
 """
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum
+from functools import cached_property
+import json
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Index, LargeBinary, func
 from sqlalchemy.orm import relationship
 from database import Base
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements pin it, but stay runnable
+    orjson = None
+
+
+def _loads_json_column(payload):
+    """Parse a JSON Text column; orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class AnalysisStatus(str, PyEnum):
     """Analysis status enum"""
@@ -61,12 +76,28 @@ class Project(Base):
         return f"<Project(id={self.id}, name='{self.name}', type={self.type})>"
 
 
-class File(Base):
+class Auditable:
+    """
+    Marker mixin: models with this mixin get audit log entries generated
+    automatically by the session flush listener in audit_service.
+
+    Subclasses set:
+    - __audit_action__: the ActionType value to log
+    - __audit_fields__: attribute names whose changes are recorded
+    """
+    __audit_action__: str = ""
+    __audit_fields__: tuple = ()
+
+
+class File(Auditable, Base):
     """
     File model - tracks uploaded files.
     Files are stored on disk, metadata in database.
     """
     __tablename__ = "files"
+
+    __audit_action__ = "FILE_UPLOADED"
+    __audit_fields__ = ("original_filename", "file_type", "file_size")
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -85,13 +116,16 @@ class File(Base):
         return f"<File(id={self.id}, original_filename='{self.original_filename}')>"
 
 
-class ExtractedText(Base):
+class ExtractedText(Auditable, Base):
     """
     ExtractedText model - stores REAL text extracted from files.
-    
+
     Phase 3: No hallucination - only actual document content.
     """
     __tablename__ = "extracted_texts"
+
+    __audit_action__ = "TEXT_EXTRACTED"
+    __audit_fields__ = ("file_id", "extraction_method", "character_count", "version")
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -163,7 +197,8 @@ class IdeaEmbedding(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), unique=True, nullable=False)
-    embedding = Column(Text, nullable=False)  # JSON array of floats
+    embedding = Column(LargeBinary, nullable=False)  # Raw little-endian float32 bytes
+    normalized = Column(Boolean, nullable=False, default=False, server_default="0")  # Unit L2 norm at write time
     text_hash = Column(String(64), nullable=False)  # For cache invalidation
     model_name = Column(String(100), nullable=False)
     dimensions = Column(Integer, nullable=False)
@@ -186,7 +221,8 @@ class EvidenceEmbedding(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     evidence_id = Column(Integer, ForeignKey("candidate_evidence.id"), unique=True, nullable=False)
-    embedding = Column(Text, nullable=False)  # JSON array of floats
+    embedding = Column(LargeBinary, nullable=False)  # Raw little-endian float32 bytes
+    normalized = Column(Boolean, nullable=False, default=False, server_default="0")  # Unit L2 norm at write time
     text_hash = Column(String(64), nullable=False)
     model_name = Column(String(100), nullable=False)
     dimensions = Column(Integer, nullable=False)
@@ -199,6 +235,26 @@ class EvidenceEmbedding(Base):
         return f"<EvidenceEmbedding(evidence_id={self.evidence_id})>"
 
 
+class EmbeddingCache(Base):
+    """
+    EmbeddingCache model - global text-hash -> vector cache.
+
+    Identical evidence text recurs across projects (the same patent turns
+    up in many searches), so a row here means each distinct text is sent
+    to the embedding provider once, ever.
+    """
+    __tablename__ = "embedding_cache"
+
+    text_hash = Column(String(64), primary_key=True)
+    embedding = Column(LargeBinary, nullable=False)  # Raw little-endian float32 bytes, unit L2 norm
+    model_name = Column(String(100), nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<EmbeddingCache(text_hash={self.text_hash[:12]}...)>"
+
+
 class SimilarityScore(Base):
     """
     SimilarityScore model - stores computed similarity between idea and evidence.
@@ -206,7 +262,16 @@ class SimilarityScore(Base):
     Phase 4: Every score links to specific evidence (no orphan scores).
     """
     __tablename__ = "similarity_scores"
-    
+
+    # One score per (project, evidence) pair - this is also the conflict
+    # target for the bulk upsert in compute_similarity. The (project_id,
+    # score) index serves the novelty-risk MAX rollup and top-match
+    # ORDER BY score DESC LIMIT 1 without touching the table.
+    __table_args__ = (
+        Index("ux_similarity_scores_project_evidence", "project_id", "evidence_id", unique=True),
+        Index("ix_similarity_scores_project_score", "project_id", "score"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     evidence_id = Column(Integer, ForeignKey("candidate_evidence.id"), nullable=False)
@@ -259,6 +324,15 @@ class AnalysisState(Base):
     )
     max_similarity_score = Column(Integer, nullable=True)  # Score * 10000
     top_evidence_id = Column(Integer, nullable=True)
+    embedding_batch_id = Column(String(100), nullable=True)  # Provider batch awaiting merge
+
+    # Per-type similarity aggregates maintained by compute_similarity at
+    # write time (the single score writer), so novelty-risk reads are a PK
+    # lookup instead of a GROUP BY. NULL counts mean "not yet precomputed".
+    research_max_score = Column(Integer, nullable=True)  # Score * 10000
+    research_match_count = Column(Integer, nullable=True)
+    patent_max_score = Column(Integer, nullable=True)
+    patent_match_count = Column(Integer, nullable=True)
     
     # Analysis status
     analysis_status = Column(
@@ -313,7 +387,13 @@ class ComparativeAnalysis(Base):
     Phase 5: Explains novelty with traceable claims.
     """
     __tablename__ = "comparative_analyses"
-    
+
+    # Serves every "latest version for this project" lookup (get_comparison,
+    # next-version bump, draft-optimization context) as an index range scan.
+    __table_args__ = (
+        Index("ix_comparative_analyses_project_version", "project_id", "version"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     version = Column(Integer, default=1, nullable=False)
@@ -328,16 +408,29 @@ class ComparativeAnalysis(Base):
     novelty_explanation = Column(Text, nullable=True)
     limitations = Column(Text, nullable=True)  # JSON array
     confidence_level = Column(String(20), nullable=True)  # low/medium/high
+    input_hash = Column(String(64), nullable=True)  # SHA256 of (idea, evidence set, risk inputs)
     
     # Metadata
     input_novelty_risk = Column(String(20), nullable=False)  # Risk at time of generation
     input_max_similarity = Column(Integer, nullable=True)  # Score at time of generation
     
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    
+
     # Relationships
     project = relationship("Project", backref="comparative_analyses")
-    
+
+    # Parsed views of the JSON Text columns, cached per instance. Analyses
+    # are write-once (a new version row is created rather than mutated), so
+    # the endpoints that feed overlaps/differentiators into draft and claim
+    # prompts can read these without re-running json.loads on every access.
+    @cached_property
+    def overlap_items(self) -> list:
+        return _loads_json_column(self.overlap_analysis) if self.overlap_analysis else []
+
+    @cached_property
+    def differentiation_items(self) -> list:
+        return _loads_json_column(self.differentiation_analysis) if self.differentiation_analysis else []
+
     def __repr__(self):
         return f"<ComparativeAnalysis(project={self.project_id}, v={self.version})>"
 
@@ -395,7 +488,13 @@ class DraftSuggestion(Base):
     Phase 6: Each suggestion is localized, explainable, and rejectable.
     """
     __tablename__ = "draft_suggestions"
-    
+
+    # Serves the draft-history rollup (counts grouped by version and status)
+    # straight from the index without touching the TEXT-heavy rows.
+    __table_args__ = (
+        Index("ix_draft_suggestions_version_status", "draft_version_id", "status"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     draft_version_id = Column(Integer, ForeignKey("draft_versions.id"), nullable=False)
     
@@ -541,7 +640,7 @@ class ClaimGenerationMetadata(Base):
     # Generation info
     model_used = Column(String(100), nullable=False)
     prompt_version = Column(String(20), nullable=False)
-    input_hash = Column(String(64), nullable=False)  # SHA256 of input
+    input_hash = Column(String(64), nullable=False)  # Truncated BLAKE2b of input (32 hex chars; width kept for legacy SHA256 rows)
     
     # Result summary
     claims_generated = Column(Integer, default=0, nullable=False)
@@ -586,14 +685,24 @@ class ConfidenceLevel(str, PyEnum):
     HIGH = "HIGH"  # Never used for legal/patent contexts
 
 
-class UserFeedback(Base):
+class UserFeedback(Auditable, Base):
     """
     UserFeedback model - stores human feedback on AI outputs.
-    
+
     Phase 9: NEVER alters original AI outputs.
     Preserves disagreement - no smoothing.
     """
     __tablename__ = "user_feedback"
+
+    __audit_action__ = "FEEDBACK_SUBMITTED"
+    __audit_fields__ = ("output_id", "output_type", "feedback_type")
+
+    # Composite indexes matching the filter + ORDER BY created_at DESC access
+    # paths in feedback_service - avoids full scans and filesorts.
+    __table_args__ = (
+        Index("ix_user_feedback_output_created", "output_id", "created_at"),
+        Index("ix_user_feedback_project_created", "project_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -610,8 +719,10 @@ class UserFeedback(Base):
     feedback_type = Column(Enum(FeedbackType), nullable=False)
     comment = Column(Text, nullable=True)
     
-    # Audit trail
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Audit trail. Python-side default keeps the value available at flush
+    # time without a refresh SELECT; the server default covers rows written
+    # outside the ORM (bulk inserts, raw SQL).
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
     ip_hash = Column(String(64), nullable=True)  # Hashed IP for abuse prevention
     
     # Relationships
@@ -628,9 +739,10 @@ class ConfidenceCalibration(Base):
     Phase 9: Rule-based calibration, transparent and reversible.
     """
     __tablename__ = "confidence_calibrations"
-    
+
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    # One calibration row per project - unique so writes can be a single upsert
+    project_id = Column(Integer, ForeignKey("projects.id"), unique=True, nullable=False)
     
     # Confidence state
     confidence_level = Column(Enum(ConfidenceLevel), default=ConfidenceLevel.LOW, nullable=False)
@@ -685,15 +797,28 @@ class AuditLog(Base):
     Append-only. No updates or deletions allowed via API.
     """
     __tablename__ = "audit_logs"
-    
+
+    # Composite indexes support the audit trail query patterns:
+    # - filter by (entity_type, entity_id), order by created_at DESC
+    # - filter by project_id, order by created_at DESC (covers child entities)
+    __table_args__ = (
+        Index("ix_audit_logs_entity_created", "entity_type", "entity_id", "created_at"),
+        Index("ix_audit_logs_project_created", "project_id", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    
+
     # What happened
     action_type = Column(Enum(ActionType), nullable=False, index=True)
-    
+
     # What was affected
     entity_type = Column(String(50), nullable=False)  # e.g., "Project", "File", "ClaimDraft"
     entity_id = Column(Integer, nullable=True)        # ID of the affected entity
+
+    # Denormalized project scope - set at log time so project-scoped history
+    # (including child entities like ClaimDraft) is an index lookup, not a
+    # metadata_json scan.
+    project_id = Column(Integer, nullable=True)
     
     # Who did it
     user_id = Column(String(100), nullable=True)      # System user ID or IP hash
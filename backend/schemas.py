@@ -258,6 +258,16 @@ class KeywordExtractionResponse(BaseModel):
     error: Optional[str] = None
 
 
+class KeywordExtractionBatchRequest(BaseModel):
+    """Request to extract keywords for several texts in one call"""
+    items: List[KeywordExtractionRequest]
+
+
+class KeywordExtractionBatchResponse(BaseModel):
+    """Per-item results for a batch keyword extraction"""
+    results: List[KeywordExtractionResponse]
+
+
 # ============== Phase 3: Evidence Retrieval Schemas ==============
 
 class EvidenceSource(str, Enum):
@@ -297,12 +307,20 @@ class RetrievalResponse(BaseModel):
     error: Optional[str] = None
 
 
+class RetrieveAllResponse(BaseModel):
+    """Combined result of concurrent paper + patent retrieval"""
+    papers: RetrievalResponse
+    patents: RetrievalResponse
+
+
 class ProjectEvidenceResponse(BaseModel):
-    """All candidate evidence for a project"""
+    """Candidate evidence for a project (paginated)"""
     project_id: int
     papers: List[EvidenceCandidateResponse]
     patents: List[EvidenceCandidateResponse]
     total_evidence: int
+    total_papers: int = 0
+    total_patents: int = 0
     notes: str = "These are candidate documents only. No similarity scores or judgments."
 
 
@@ -755,6 +773,16 @@ class FeedbackResponse(BaseModel):
     timestamp: str
 
 
+class FeedbackBatchRequest(BaseModel):
+    """Request to submit several feedback entries in one transaction."""
+    items: List[FeedbackRequest]
+
+
+class FeedbackBatchResponse(BaseModel):
+    """Per-item results for a batch feedback submission."""
+    results: List[FeedbackResponse]
+
+
 class FeedbackItem(BaseModel):
     """Single feedback item."""
     id: int